@@ -0,0 +1,62 @@
+"""Tests for settings persistence across the first-launch setup wizard."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import video_app_v8 as app  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+
+class SetupWizardConfigTest(unittest.TestCase):
+    """Saves made by the main window must not undo what the setup wizard saved."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.qapp = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.home = tempfile.TemporaryDirectory()
+        self.old_home = os.environ.get("HOME")
+        os.environ["HOME"] = self.home.name
+        self._clear_caches()
+        self.old_exec = app.SetupWizard.exec_
+        # Stand-in for the user clicking through the wizard and pressing Finish
+        app.SetupWizard.exec_ = lambda wizard: wizard.complete_setup()
+
+    def tearDown(self):
+        app.SetupWizard.exec_ = self.old_exec
+        if self.old_home is None:
+            os.environ.pop("HOME", None)
+        else:
+            os.environ["HOME"] = self.old_home
+        self._clear_caches()
+        self.home.cleanup()
+
+    @staticmethod
+    def _clear_caches():
+        for getter in (app.get_config_path, app.get_base_dir, app.get_downloads_dir,
+                       app.get_subtitles_dir, app.get_output_dir, app.get_remuxed_dir):
+            getter.cache_clear()
+        app.invalidate_config_cache()
+
+    def test_save_whisper_model_keeps_wizard_settings(self):
+        window = app.VideoProcessingApp()
+        try:
+            window.save_whisper_model("small")
+        finally:
+            window.close()
+            window.deleteLater()
+
+        saved = app.load_config()
+        self.assertTrue(saved["setup_complete"])
+        self.assertEqual(saved["whisper_model"], "small")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,17 +7,37 @@ A PyQt5 desktop app that provides a button-based interface for all video process
 import sys
 import os
 import json
+import copy
+import functools
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 import re
 import shlex
 import subprocess
 import shutil
+import struct
+import threading
 import time
 import traceback
 import platform
 import tempfile
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+
+# Optional faster JSON backend for the settings file; falls back to the stdlib
+try:
+    import orjson
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    _json_loads = json.loads
 
 
 def quote_path(path: str) -> str:
@@ -44,8 +64,13 @@ def extract_cookies_from_har(har_file: Path) -> Optional[str]:
         return None
     
     try:
-        with open(har_file, 'r', encoding='utf-8') as f:
-            har_data = json.load(f)
+        # HAR exports can be many MB, so try the faster settings JSON backend first;
+        # orjson rejects NaN and lone surrogate escapes that stdlib json accepts
+        raw = har_file.read_bytes()
+        try:
+            har_data = _json_loads(raw)
+        except ValueError:
+            har_data = json.loads(raw)
         
         # Collect cookies from all requests and responses
         cookies = {}
@@ -111,13 +136,17 @@ def get_temp_dir() -> str:
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QTextEdit, QFileDialog, QDialog,
+    QPushButton, QLabel, QTextEdit, QPlainTextEdit, QFileDialog, QDialog,
     QLineEdit, QFormLayout, QMessageBox, QProgressBar, QGroupBox, QStyleFactory, QCheckBox, QStackedWidget, QTextBrowser, QComboBox,
-    QGraphicsDropShadowEffect, QTabWidget, QSpinBox, QDoubleSpinBox, QScrollArea, QTimeEdit, QListWidget, QListWidgetItem, QTreeWidget, QTreeWidgetItem, QHeaderView, QMenu
+    QGraphicsDropShadowEffect, QTabWidget, QSpinBox, QDoubleSpinBox, QScrollArea, QTimeEdit, QListWidget, QListWidgetItem, QTreeWidget, QTreeWidgetItem, QHeaderView, QMenu,
+    QStyledItemDelegate, QStyle, QStyleOptionButton, QStyleOptionComboBox
 )
-from PyQt5.QtCore import QThread, pyqtSignal, Qt, QProcess, QUrl, QTime, QTimer
-from PyQt5.QtGui import QFont, QIcon, QPainter, QPen, QDesktopServices
+from PyQt5.QtCore import QPointF, QThread, pyqtSignal, Qt, QProcess, QUrl, QTime, QTimer, QObject, QRunnable, QThreadPool, QEvent, QModelIndex
+from PyQt5.QtGui import QFont, QIcon, QPainter, QPen, QDesktopServices, QStandardItemModel, QStandardItem, QPalette, QColor, QTextLayout
+
 
+# Application version shown in the header and About dialog
+APP_VERSION = "9.2.2"
 
 # URL for download instructions (rentry.co page - update when creating the page)
 DOWNLOAD_INSTRUCTIONS_URL = "https://rentry.co/sp-workshop"
@@ -129,36 +158,135 @@ DOWNLOAD_INSTRUCTIONS_URL = "https://rentry.co/sp-workshop"
 class OutlinedLabel(QLabel):
     """QLabel with text outline effect."""
     
+    _OUTLINE_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._text_layout = None
+        self._text_layout_key = None  # (text, font key) the layout was built for
+    
+    def _get_text_layout(self) -> QTextLayout:
+        """Shape the text once per text/font change; all nine draws in paintEvent reuse it."""
+        key = (self.text(), self.font().key())
+        if key != self._text_layout_key:
+            layout = QTextLayout(key[0], self.font(), self)
+            layout.beginLayout()
+            layout.createLine()
+            layout.endLayout()
+            self._text_layout = layout
+            self._text_layout_key = key
+        return self._text_layout
+    
     def paintEvent(self, event):
+        if not self.text():
+            return
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Get text metrics
-        font = self.font()
-        painter.setFont(font)
-        text = self.text()
+        # Center the single line in the label, like drawText with Qt.AlignCenter
+        layout = self._get_text_layout()
+        line = layout.lineAt(0)
+        x = (self.width() - line.naturalTextWidth()) / 2
+        y = (self.height() - line.height()) / 2
         
         # Draw black outline by drawing text multiple times with offsets
         pen = QPen(Qt.black, 2, Qt.SolidLine)
         painter.setPen(pen)
-        
-        # Draw outline in all directions
-        offsets = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-        for dx, dy in offsets:
-            painter.drawText(self.rect().adjusted(dx, dy, dx, dy), Qt.AlignCenter, text)
+        for dx, dy in self._OUTLINE_OFFSETS:
+            layout.draw(painter, QPointF(x + dx, y + dy))
         
         # Draw white text on top
         pen.setColor(Qt.white)
         painter.setPen(pen)
-        painter.drawText(self.rect(), Qt.AlignCenter, text)
+        layout.draw(painter, QPointF(x, y))
+
+
+# Item data role marking remux tree cells drawn by RemuxTreeDelegate ("format" or "button")
+REMUX_CELL_ROLE = Qt.UserRole + 1
+
+# Remux tree track row type prefix -> key in the analyze_tracks result
+_TRACK_TYPE_KEYS = {'video': 'video', 'audio': 'audio', 'subtitle': 'subtitles'}
+
+# Remux tree track row type prefix -> per-file config key holding the checked track ids
+_SELECTED_TRACK_KEYS = {'video': 'selected_video_tracks', 'audio': 'selected_audio_tracks',
+                        'subtitle': 'selected_subtitle_tracks'}
+
+# Output formats offered per file in the remux tree: (label, extension)
+REMUX_OUTPUT_FORMATS = (("MKV", "mkv"), ("MP4", "mp4"))
+
+
+class RemuxTreeDelegate(QStyledItemDelegate):
+    """Paints the remux tree's combo box and button cells instead of embedding widgets.
+    
+    A real QComboBox only exists while an output format cell is being edited;
+    button cells are painted and report clicks through button_clicked.
+    """
+    button_clicked = pyqtSignal(QModelIndex)
+    
+    def paint(self, painter, option, index):
+        kind = index.data(REMUX_CELL_ROLE)
+        if kind is None:
+            super().paint(painter, option, index)
+            return
+        style = option.widget.style() if option.widget else QApplication.style()
+        if kind == "format":
+            combo_opt = QStyleOptionComboBox()
+            combo_opt.rect = option.rect
+            combo_opt.state = option.state | QStyle.State_Enabled
+            combo_opt.currentText = index.data(Qt.DisplayRole) or ""
+            style.drawComplexControl(QStyle.CC_ComboBox, combo_opt, painter, option.widget)
+            style.drawControl(QStyle.CE_ComboBoxLabel, combo_opt, painter, option.widget)
+        else:
+            button_opt = QStyleOptionButton()
+            button_opt.rect = option.rect
+            button_opt.state = QStyle.State_Enabled | QStyle.State_Raised
+            button_opt.text = index.data(Qt.DisplayRole) or ""
+            style.drawControl(QStyle.CE_PushButton, button_opt, painter, option.widget)
+    
+    def editorEvent(self, event, model, option, index):
+        kind = index.data(REMUX_CELL_ROLE)
+        if kind is not None and event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if kind == "format":
+                self.parent().edit(index)
+            else:
+                self.button_clicked.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+    
+    def createEditor(self, parent, option, index):
+        if index.data(REMUX_CELL_ROLE) != "format":
+            return None
+        editor = QComboBox(parent)
+        for label, ext in REMUX_OUTPUT_FORMATS:
+            editor.addItem(label, ext)
+        editor.activated.connect(lambda _idx, e=editor: self._commit_and_close(e))
+        return editor
+    
+    def _commit_and_close(self, editor):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+    
+    def setEditorData(self, editor, index):
+        pos = editor.findData(index.data(Qt.UserRole))
+        if pos >= 0:
+            editor.setCurrentIndex(pos)
+        editor.showPopup()
+    
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentData(), Qt.UserRole)
+        model.setData(index, editor.currentText(), Qt.DisplayRole)
+    
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
 
 
 # ============================================================================
 # Configuration Management
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
-    """Get the path to the configuration directory."""
+    """Get the path to the configuration directory; the folder is created on first call only."""
     base_dir = Path.home() / "VideoProcessing"
     config_dir = base_dir / "config"
     config_dir.mkdir(parents=True, exist_ok=True)
@@ -179,40 +307,105 @@ def load_config() -> Dict:
         "use_watermarks": True,
         "whisper_output_format": "srt",
         "whisper_options": {
-            "extra_args": "",
-            "extra_args_parsed": ""
+            "extra_args": ""
         }
     }
     
     if config_path.exists():
         try:
-            with open(config_path, 'r') as f:
-                user_config = json.load(f)
-                # Merge whisper_options separately to ensure all defaults exist
-                if "whisper_options" in user_config:
-                    default_config["whisper_options"].update(user_config["whisper_options"])
-                    del user_config["whisper_options"]
-                default_config.update(user_config)
+            user_config = _json_loads(config_path.read_bytes())
+            # Merge whisper_options separately to ensure all defaults exist
+            if "whisper_options" in user_config:
+                default_config["whisper_options"].update(user_config["whisper_options"])
+                del user_config["whisper_options"]
+            default_config.update(user_config)
         except Exception as e:
             print(f"Error loading config: {e}")
     
     return default_config
 
 
+def _config_mtime_ns(config_path: Path) -> int:
+    """Modification time of the settings file, or 0 when it does not exist yet."""
+    try:
+        return config_path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
 def save_config(config: Dict):
-    """Save configuration to JSON file."""
-    config_path = get_config_path()
+    """Save configuration to JSON file (skipped when nothing changed)."""
+    global _CONFIG_CACHE, _CONFIG_MTIME_NS
+    with _CONFIG_LOCK:
+        if _CONFIG_CACHE is not None and config == _CONFIG_CACHE:
+            return
+        config_path = get_config_path()
+        tmp_path = config_path.with_name(config_path.name + ".tmp")
+        try:
+            # Write to a temp file and swap it in so a crash never leaves a half-written config
+            with open(tmp_path, "wb") as f:
+                f.write(_json_dumps(config))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, config_path)
+            _CONFIG_CACHE = copy.deepcopy(config)
+            _CONFIG_MTIME_NS = _config_mtime_ns(config_path)
+        except Exception as e:
+            print(f"Error saving config: {e}")
+            _CONFIG_CACHE = None
+
+
+# In-memory copy of the configuration shared by dialogs (None = not loaded yet),
+# plus the settings file mtime it was read at so outside edits are picked up
+_CONFIG_CACHE: Optional[Dict] = None
+_CONFIG_MTIME_NS = -1
+# Serializes cache reloads and saves so a write from any thread never interleaves with a reload
+_CONFIG_LOCK = threading.Lock()
+
+
+def get_config() -> Dict:
+    """Get a copy of the configuration, re-reading the file only when its mtime changed."""
+    global _CONFIG_CACHE, _CONFIG_MTIME_NS
+    with _CONFIG_LOCK:
+        mtime_ns = _config_mtime_ns(get_config_path())
+        if _CONFIG_CACHE is None or mtime_ns != _CONFIG_MTIME_NS:
+            _CONFIG_CACHE = load_config()
+            _CONFIG_MTIME_NS = mtime_ns
+        return copy.deepcopy(_CONFIG_CACHE)
+
+
+def invalidate_config_cache():
+    """Drop the cached configuration so the next get_config() re-reads the file."""
+    global _CONFIG_CACHE
+    with _CONFIG_LOCK:
+        _CONFIG_CACHE = None
+
+
+# Collapses runs of whitespace (including newlines) in user-typed extra arguments
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=1)
+def parse_whisper_extra_args(extra_args_text: str) -> str:
+    """Convert multiline Whisper extra arguments to the one-argument-per-line form used by the script.
+    
+    Arguments are split like a shell would, so quoted values (e.g. paths with spaces)
+    stay a single argument. Unbalanced quotes fall back to plain whitespace splitting.
+    """
     try:
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
-    except Exception as e:
-        print(f"Error saving config: {e}")
+        args = shlex.split(extra_args_text)
+    except ValueError:
+        args = _WHITESPACE_RE.split(extra_args_text.strip())
+    return "\n".join(arg for arg in args if arg)
 
 
 # ============================================================================
 # Directory Management (Fixed Structure)
 # ============================================================================
+# The folder layout never changes while the app runs, so each getter creates its
+# folder on first use and then returns the cached Path without touching the disk.
 
+@functools.lru_cache(maxsize=1)
 def get_base_dir() -> Path:
     """Get the base VideoProcessing directory."""
     base_dir = Path.home() / "VideoProcessing"
@@ -220,6 +413,7 @@ def get_base_dir() -> Path:
     return base_dir
 
 
+@functools.lru_cache(maxsize=1)
 def get_downloads_dir() -> Path:
     """Get the downloads directory."""
     downloads_dir = get_base_dir() / "downloads"
@@ -227,6 +421,7 @@ def get_downloads_dir() -> Path:
     return downloads_dir
 
 
+@functools.lru_cache(maxsize=1)
 def get_subtitles_dir() -> Path:
     """Get the subtitles directory."""
     subtitles_dir = get_base_dir() / "subtitles"
@@ -234,6 +429,7 @@ def get_subtitles_dir() -> Path:
     return subtitles_dir
 
 
+@functools.lru_cache(maxsize=1)
 def get_output_dir() -> Path:
     """Get the output directory."""
     output_dir = get_base_dir() / "output"
@@ -254,9 +450,12 @@ def open_folder_in_explorer(folder_path: Path):
         subprocess.run(["xdg-open", folder_str])
 
 
+@functools.lru_cache(maxsize=1)
 def get_app_icon() -> QIcon:
     """Load application icon, preferring .icns on macOS, with fallback to PNG and default.
     
+    The icon is loaded once and shared by every caller.
+    
     Note: For best results on macOS, use a PNG with transparent background (alpha channel)
     and convert it to .icns using the create_icon.sh script. The icon should be at least
     1024x1024 pixels for best quality.
@@ -287,6 +486,7 @@ def get_app_icon() -> QIcon:
     return QIcon()
 
 
+@functools.lru_cache(maxsize=1)
 def get_remuxed_dir() -> Path:
     """Get the remuxed directory."""
     remuxed_dir = get_base_dir() / "remuxed"
@@ -294,6 +494,27 @@ def get_remuxed_dir() -> Path:
     return remuxed_dir
 
 
+# cp flags that clone the file (copy-on-write) where the filesystem supports it
+_CLONE_COPY_FLAGS = {"Darwin": "-c", "Linux": "--reflink=auto"}
+
+
+def copy_file_fast(src: Path, dst: Path):
+    """Copy a file with its metadata, cloning it instead of copying bytes where possible.
+    
+    APFS (macOS) and Btrfs/XFS (Linux) clone a file in constant time; anything else
+    falls back to shutil.copy2, which still copies in the kernel on macOS and Linux.
+    """
+    clone_flag = _CLONE_COPY_FLAGS.get(platform.system())
+    if clone_flag and shutil.which("cp"):
+        try:
+            subprocess.run(["cp", clone_flag, str(src), str(dst)], check=True, capture_output=True)
+            shutil.copystat(src, dst)
+            return
+        except (OSError, subprocess.CalledProcessError):
+            pass  # e.g. cp -c on a non-APFS volume
+    shutil.copy2(src, dst)
+
+
 def check_whisper_model_exists(model_name: str) -> bool:
     """Check if a Whisper model already exists in the default cache location.
     
@@ -334,82 +555,218 @@ def check_whisper_model_exists(model_name: str) -> bool:
 # Video Analysis Functions
 # ============================================================================
 
-def get_video_duration(video_path: Path) -> Optional[float]:
-    """Get video duration in minutes using ffprobe."""
+@functools.lru_cache(maxsize=256)
+def _probe_media_cached(path_str: str, size: int, mtime_ns: int) -> Dict:
+    """Run one ffprobe for a file's format and streams; size and mtime_ns only key the cache.
+    
+    Failures raise and are therefore never cached.
+    """
+    # One demux thread per probe; probe_many runs several probes side by side
+    cmd = ["ffprobe", "-v", "error", "-threads", "1", "-show_format", "-show_streams",
+           "-of", "json", path_str]
+    result = subprocess.run(cmd, capture_output=True, timeout=10)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe failed for {path_str}")
+    return _json_loads(result.stdout)
+
+
+def probe_media(video_path: Path) -> Optional[Dict]:
+    """Get ffprobe's format + streams JSON for a file, probed once per file version.
+    
+    The dict is shared between callers and must not be modified. Returns None if the
+    file is missing or ffprobe fails.
+    """
     try:
-        cmd = [
-            "ffprobe", "-v", "error", "-show_entries",
-            "format=duration", "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path)
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            duration_seconds = float(result.stdout.strip())
-            return duration_seconds / 60.0  # Convert to minutes
+        stat = video_path.stat()
+        return _probe_media_cached(str(video_path), stat.st_size, stat.st_mtime_ns)
     except Exception:
-        pass
+        return None
+
+
+def probe_many(video_paths: List[Path]) -> List[Optional[Dict]]:
+    """Probe several files concurrently, warming the probe_media cache for each.
+    
+    ffprobe is I/O bound, so more workers than cores still pays off.
+    """
+    if not video_paths:
+        return []
+    max_workers = min(len(video_paths), 32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(probe_media, video_paths))
+
+
+def get_video_duration(video_path: Path) -> Optional[float]:
+    """Get video duration in minutes using ffprobe."""
+    duration_seconds = get_video_duration_seconds(video_path)
+    return duration_seconds / 60.0 if duration_seconds is not None else None
+
+
+_MP4_SUFFIXES = {".mp4", ".mov", ".m4v"}
+_MKV_SUFFIXES = {".mkv", ".webm"}
+
+# Matroska element IDs (marker bits kept) needed to reach Segment > Info > Duration
+_EBML_HEADER_ID = 0x1A45DFA3
+_EBML_SEGMENT_ID = 0x18538067
+_EBML_INFO_ID = 0x1549A966
+_EBML_CLUSTER_ID = 0x1F43B675
+_EBML_TIMECODE_SCALE_ID = 0x2AD7B1
+_EBML_DURATION_ID = 0x4489
+
+
+def _read_mp4_duration(f) -> Optional[float]:
+    """Read moov > mvhd duration from an MP4/MOV file opened in binary mode."""
+    end = os.fstat(f.fileno()).st_size
+    offset = 0
+    while offset + 8 <= end:
+        f.seek(offset)
+        size, box_type = struct.unpack(">I4s", f.read(8))
+        header_size = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size:
+            return None
+        if box_type == b"moov":
+            # Descend into moov and keep walking its children
+            end = offset + size
+            offset += header_size
+            continue
+        if box_type == b"mvhd":
+            version = f.read(4)[0]
+            if version == 1:
+                _, _, timescale, duration = struct.unpack(">QQIQ", f.read(28))
+            else:
+                _, _, timescale, duration = struct.unpack(">IIII", f.read(16))
+            return duration / timescale if timescale and duration else None
+        offset += size
     return None
 
 
+def _read_ebml_vint(f, keep_marker: bool) -> Optional[int]:
+    """Read an EBML variable-length integer; None at EOF or for an unknown size."""
+    first = f.read(1)
+    if not first:
+        return None
+    length = 1
+    mask = 0x80
+    while length <= 8 and not first[0] & mask:
+        length += 1
+        mask >>= 1
+    if length > 8:
+        return None
+    rest = f.read(length - 1)
+    if len(rest) < length - 1:
+        return None
+    value = first[0] if keep_marker else first[0] & (mask - 1)
+    for byte in rest:
+        value = (value << 8) | byte
+    if not keep_marker and value == (1 << (7 * length)) - 1:
+        return None
+    return value
+
+
+def _read_mkv_duration(f) -> Optional[float]:
+    """Read Segment > Info > Duration from a Matroska/WebM file opened in binary mode."""
+    if _read_ebml_vint(f, True) != _EBML_HEADER_ID:
+        return None
+    header_size = _read_ebml_vint(f, False)
+    if header_size is None:
+        return None
+    f.seek(header_size, os.SEEK_CUR)
+    if _read_ebml_vint(f, True) != _EBML_SEGMENT_ID:
+        return None
+    _read_ebml_vint(f, False)  # Segment size, often unknown for live-written files
+    while True:
+        element_id = _read_ebml_vint(f, True)
+        element_size = _read_ebml_vint(f, False)
+        if element_id is None or element_size is None or element_id == _EBML_CLUSTER_ID:
+            return None
+        if element_id != _EBML_INFO_ID:
+            f.seek(element_size, os.SEEK_CUR)
+            continue
+        info_end = f.tell() + element_size
+        timecode_scale = 1000000
+        duration = None
+        while f.tell() < info_end:
+            child_id = _read_ebml_vint(f, True)
+            child_size = _read_ebml_vint(f, False)
+            if child_id is None or child_size is None:
+                return None
+            data = f.read(child_size)
+            if child_id == _EBML_TIMECODE_SCALE_ID:
+                timecode_scale = int.from_bytes(data, "big")
+            elif child_id == _EBML_DURATION_ID and child_size in (4, 8):
+                duration = struct.unpack(">f" if child_size == 4 else ">d", data)[0]
+        return duration * timecode_scale / 1e9 if duration else None
+
+
+def read_container_duration(video_path: Path) -> Optional[float]:
+    """Read duration in seconds straight from MP4/MKV headers, without spawning ffprobe.
+    
+    Returns None for other formats or when the header lacks a usable duration.
+    """
+    suffix = video_path.suffix.lower()
+    if suffix in _MP4_SUFFIXES:
+        reader = _read_mp4_duration
+    elif suffix in _MKV_SUFFIXES:
+        reader = _read_mkv_duration
+    else:
+        return None
+    try:
+        with open(video_path, "rb") as f:
+            return reader(f)
+    except (OSError, struct.error, IndexError):
+        return None
+
+
 def get_video_duration_seconds(video_path: Path) -> Optional[float]:
-    """Get video duration in seconds using ffprobe."""
+    """Get video duration in seconds, from the container header or else ffprobe."""
+    duration = read_container_duration(video_path)
+    if duration is not None:
+        return duration
+    probe_data = probe_media(video_path)
+    if not probe_data:
+        return None
     try:
-        cmd = [
-            "ffprobe", "-v", "error", "-show_entries",
-            "format=duration", "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path)
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            return float(result.stdout.strip())
-    except Exception:
-        pass
-    return None
+        duration = probe_data.get("format", {}).get("duration")
+        if duration is not None:
+            return float(duration)
+        # Some containers only report durations per stream
+        stream_durations = [float(stream["duration"]) for stream in probe_data.get("streams", [])
+                            if "duration" in stream]
+        return max(stream_durations) if stream_durations else None
+    except (TypeError, ValueError):
+        return None
 
 
 def get_audio_channels(video_path: Path) -> Optional[int]:
     """Get audio channel count using ffprobe."""
-    try:
-        cmd = [
-            "ffprobe", "-v", "error", "-select_streams", "a:0",
-            "-show_entries", "stream=channels",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path)
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            channels_str = result.stdout.strip()
-            if channels_str:
-                return int(channels_str)
-    except Exception:
-        pass
+    probe_data = probe_media(video_path)
+    if not probe_data:
+        return None
+    audio_stream = next((stream for stream in probe_data.get("streams", [])
+                         if stream.get("codec_type") == "audio"), None)
+    if audio_stream and audio_stream.get("channels"):
+        return int(audio_stream["channels"])
     return None
 
 
+# HH:MM:SS.ms, MM:SS.ms or SS.ms; hours only match when both colons are present
+_FFMPEG_TIME_RE = re.compile(r"^\s*(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d*)?)\s*$")
+
+
 def parse_ffmpeg_time(time_str: str) -> Optional[float]:
     """Parse FFmpeg time string (HH:MM:SS.ms or MM:SS.ms) to seconds."""
+    match = _FFMPEG_TIME_RE.match(time_str)
+    if match:
+        hours, minutes, seconds = match.groups()
+        return int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds)
     try:
-        # Remove any whitespace
-        time_str = time_str.strip()
-        
-        # Split by colon
-        parts = time_str.split(':')
-        
-        if len(parts) == 3:
-            # Format: HH:MM:SS.ms
-            hours = float(parts[0])
-            minutes = float(parts[1])
-            seconds = float(parts[2])
-            return hours * 3600 + minutes * 60 + seconds
-        elif len(parts) == 2:
-            # Format: MM:SS.ms
-            minutes = float(parts[0])
-            seconds = float(parts[1])
-            return minutes * 60 + seconds
-        else:
-            # Try parsing as just seconds
-            return float(time_str)
-    except (ValueError, IndexError):
+        # Anything else, e.g. "1e3" or "N/A", only parses as plain seconds
+        return float(time_str)
+    except ValueError:
         return None
 
 
@@ -532,6 +889,16 @@ def detect_episode_or_scene(video_path: Path) -> tuple[str, Optional[float]]:
         return "scene", duration
 
 
+def snapshot_mkv_mtimes(folder: Path) -> Dict[str, int]:
+    """Map the .mkv file names in a folder to their mtime (ns), from a single scandir pass."""
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name: entry.stat().st_mtime_ns for entry in entries
+                    if entry.name.lower().endswith(".mkv") and entry.is_file()}
+    except OSError:
+        return {}
+
+
 def open_in_lossless_cut(video_paths: List[Path], log_callback=None) -> bool:
     """Open video file(s) in LosslessCut application (cross-platform).
     
@@ -1223,6 +1590,10 @@ def process_video(selected_video_files: List[Path], subtitles_dir: Path, output_
             log_callback("No valid video files selected.")
         return False
     
+    # Durations mostly come from the container header, but the audio channel count
+    # still needs ffprobe, so run those probes up front instead of one file at a time
+    probe_many(video_files)
+    
     success_count = 0
     height = "720" if resolution == "720" else "1080"
     preset = "medium" if resolution == "720" else "slow"
@@ -1502,13 +1873,16 @@ def analyze_tracks(video_path: Path, log_callback=None) -> Dict:
             'audio': [{'track_id': int, 'codec': str, 'channels': int, 'sample_rate': int, 'language': str, ...}],
             'subtitles': [{'track_id': int, 'codec': str, 'language': str, ...}]
         }
+        plus 'failed': True when the file could not be probed at all, so the empty
+        result is not mistaken for a file without tracks.
     """
     tracks = {'video': [], 'audio': [], 'subtitles': []}
+    failed = {'video': [], 'audio': [], 'subtitles': [], 'failed': True}
     
     if not video_path.exists():
         if log_callback:
             log_callback(f"Error: File not found: {video_path}")
-        return tracks
+        return failed
     
     try:
         # Try mkvmerge first (best for MKV files)
@@ -1577,14 +1951,16 @@ def analyze_tracks(video_path: Path, log_callback=None) -> Dict:
                 pass
         
         # Use ffprobe (works for all formats)
+        # Stream metadata sits in the MKV/MP4 header, so a short probe window is enough
         cmd = [
-            'ffprobe', '-v', 'quiet', '-print_format', 'json',
-            '-show_streams', str(video_path)
+            'ffprobe', '-v', 'quiet', '-probesize', '1M', '-analyzeduration', '1M',
+            '-print_format', 'json', '-show_streams', str(video_path)
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        # Raw bytes straight into the JSON parser (orjson when available), no text decode
+        result = subprocess.run(cmd, capture_output=True, timeout=30)
         
         if result.returncode == 0:
-            data = json.loads(result.stdout)
+            data = _json_loads(result.stdout)
             
             for stream in data.get('streams', []):
                 stream_type = stream.get('codec_type', '')
@@ -1618,13 +1994,98 @@ def analyze_tracks(video_path: Path, log_callback=None) -> Dict:
                     else:
                         track_info['format'] = codec.upper()
                     tracks['subtitles'].append(track_info)
+            
+            return tracks
         
-        return tracks
+        return failed
         
     except Exception as e:
         if log_callback:
             log_callback(f"Error analyzing tracks: {e}")
+        return failed
+
+
+# analyze_tracks results keyed by str(path): {"size", "mtime_ns", "tracks"} (None = not loaded yet)
+_TRACK_CACHE: Optional[Dict[str, Dict]] = None
+_TRACK_CACHE_LOCK = threading.Lock()  # Probes run on the thread pool
+_TRACK_CACHE_MAX_ENTRIES = 500
+
+
+def get_track_cache_path() -> Path:
+    """Get the path of the persisted track analysis cache."""
+    return get_config_path().with_name("track_cache.json")
+
+
+def _get_track_cache() -> Dict[str, Dict]:
+    """Get the track cache, reading it from disk on first use (call with the lock held)."""
+    global _TRACK_CACHE
+    if _TRACK_CACHE is None:
+        _TRACK_CACHE = {}
+        cache_path = get_track_cache_path()
+        if cache_path.exists():
+            try:
+                # Drop entries without any stream; older builds cached failed probes
+                _TRACK_CACHE = {path: entry for path, entry in _json_loads(cache_path.read_bytes()).items()
+                                if _has_tracks(entry.get("tracks", {}))}
+            except Exception as e:
+                print(f"Error loading track cache: {e}")
+    return _TRACK_CACHE
+
+
+def _has_tracks(tracks: Dict) -> bool:
+    """Whether an analyze_tracks result is a successful probe that found any stream."""
+    return not tracks.get('failed') and any(tracks.get(key) for key in ('video', 'audio', 'subtitles'))
+
+
+def analyze_tracks_cached(video_path: Path) -> Dict:
+    """Analyze video file tracks, reusing the result while the file's size and mtime are unchanged."""
+    try:
+        stat = video_path.stat()
+    except OSError:
+        return analyze_tracks(video_path)
+    key = str(video_path)
+    with _TRACK_CACHE_LOCK:
+        entry = _get_track_cache().get(key)
+    if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+        return copy.deepcopy(entry["tracks"])
+    
+    tracks = analyze_tracks(video_path)
+    if not _has_tracks(tracks):
+        # Failed or empty probes are retried next time instead of sticking around
         return tracks
+    with _TRACK_CACHE_LOCK:
+        cache = _get_track_cache()
+        cache.pop(key, None)  # Re-insert so the newest probes come last
+        cache[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "tracks": tracks}
+    return copy.deepcopy(tracks)
+
+
+def clear_analyze_cache(video_paths=None):
+    """Forget cached analyze_tracks results for the given files, or for all files."""
+    with _TRACK_CACHE_LOCK:
+        cache = _get_track_cache()
+        if video_paths is None:
+            cache.clear()
+        else:
+            for video_path in video_paths:
+                cache.pop(str(video_path), None)
+
+
+def save_track_cache():
+    """Persist the track cache so probes are not repeated on the next launch."""
+    with _TRACK_CACHE_LOCK:
+        if _TRACK_CACHE is None:
+            return
+        # Keep the most recently probed files that still exist
+        entries = [(path, entry) for path, entry in _TRACK_CACHE.items() if os.path.exists(path)]
+        cache = dict(entries[-_TRACK_CACHE_MAX_ENTRIES:])
+    cache_path = get_track_cache_path()
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(_json_dumps(cache))
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Error saving track cache: {e}")
 
 
 def split_audio_channels(video_path: Path, output_dir: Path, 
@@ -1650,37 +2111,23 @@ def split_audio_channels(video_path: Path, output_dir: Path,
     success_count = 0
     
     try:
-        # Extract audio first, then split channels
-        temp_audio = output_dir / f"{base_name}_temp_audio.wav"
-        
-        # First extract audio to WAV
-        cmd_extract = [
-            'ffmpeg', '-i', str(video_path),
-            '-vn', '-acodec', 'pcm_s16le', '-ar', '48000',
-            '-y', str(temp_audio)
-        ]
-        
-        result = subprocess.run(cmd_extract, capture_output=True, text=True, timeout=300)
-        if result.returncode != 0:
-            if log_callback:
-                log_callback(f"Error extracting audio: {result.stderr}")
-            return False
-        
-        # Now split into individual channels
-        for channel in range(channel_count):
-            channel_num = channel + 1  # 1-indexed
-            output_file = output_dir / f"{base_name}_channel_{channel_num}.wav"
-            
-            # Extract individual channel using pan filter
-            # pan=mono|c0=c{channel} extracts channel {channel} to mono output
-            cmd_split = [
-                'ffmpeg', '-i', str(temp_audio),
-                '-af', f'pan=mono|c0=c{channel}',
-                '-y', str(output_file)
-            ]
-            
-            result = subprocess.run(cmd_split, capture_output=True, text=True, timeout=300)
-            
+        # Split every channel in one ffmpeg pass: asplit copies the first audio stream,
+        # and pan=mono|c0=c{channel} turns each copy into one mono channel
+        channels = range(channel_count)
+        output_files = [output_dir / f"{base_name}_channel_{channel + 1}.wav" for channel in channels]
+        filter_graph = ";".join([
+            f"[0:a:0]asplit={channel_count}" + "".join(f"[a{channel}]" for channel in channels),
+            *(f"[a{channel}]pan=mono|c0=c{channel}[c{channel}]" for channel in channels),
+        ])
+        cmd = ['ffmpeg', '-y', '-i', str(video_path), '-filter_complex', filter_graph]
+        for channel, output_file in zip(channels, output_files):
+            cmd.extend(('-map', f'[c{channel}]', '-acodec', 'pcm_s16le', '-ar', '48000', str(output_file)))
+        
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        if result.returncode != 0 and log_callback:
+            log_callback(f"Error splitting audio channels: {result.stderr}")
+        
+        for channel_num, output_file in enumerate(output_files, start=1):
             if result.returncode == 0 and output_file.exists():
                 success_count += 1
                 if log_callback:
@@ -1689,10 +2136,6 @@ def split_audio_channels(video_path: Path, output_dir: Path,
                 if log_callback:
                     log_callback(f"  ✗ Failed to extract channel {channel_num}")
         
-        # Clean up temp file
-        if temp_audio.exists():
-            temp_audio.unlink()
-        
         return success_count > 0
         
     except Exception as e:
@@ -1757,6 +2200,66 @@ def convert_audio_format(video_path: Path, output_path: Path,
         return False
 
 
+def run_ffmpeg_tail(cmd: List[str], timeout: float, tail_lines: int) -> Tuple[int, List[str]]:
+    """Run an ffmpeg command, keeping only the last few lines of its stderr.
+    
+    stdout is discarded and stderr is streamed through a bounded deque, so a long
+    log never piles up in memory. Raises subprocess.TimeoutExpired like subprocess.run.
+    
+    Returns:
+        (return code, last stderr lines)
+    """
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               bufsize=1024 * 1024)
+    timed_out = threading.Event()
+    
+    def kill_on_timeout():
+        timed_out.set()
+        process.kill()
+    
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.start()
+    try:
+        with process.stderr:
+            tail = deque(process.stderr, maxlen=tail_lines)
+        returncode = process.wait()
+    finally:
+        timer.cancel()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return returncode, [line.decode(errors="replace").rstrip() for line in tail]
+
+
+@functools.lru_cache(maxsize=64)
+def _dir_entry_names(folder_str: str) -> Dict[str, str]:
+    """List a folder once: lowercased file name -> actual file name."""
+    try:
+        with os.scandir(folder_str) as entries:
+            return {entry.name.lower(): entry.name for entry in entries}
+    except OSError:
+        return {}
+
+
+def clear_dir_listing_cache():
+    """Forget cached folder listings so newly created subtitle files are seen."""
+    _dir_entry_names.cache_clear()
+
+
+def find_sibling_subtitle(folder: Path, base: str) -> Optional[Path]:
+    """Find <base>.srt (preferred) or <base>.vtt in a folder using its cached listing."""
+    names = _dir_entry_names(str(folder))
+    for suffix in (".srt", ".vtt"):
+        name = names.get(f"{base}{suffix}".lower())
+        if name:
+            return folder / name
+    return None
+
+
+def subtitle_codec(subtitle_file: Path) -> str:
+    """FFmpeg subtitle codec for a .srt/.vtt file, from a single lowercased suffix lookup."""
+    return "srt" if subtitle_file.suffix.lower() == ".srt" else "vtt"
+
+
 def remux_mkv_with_srt_batch(folder_path: Path, output_format: str = "mkv", 
                              progress_callback=None, log_callback=None) -> bool:
     """Batch remux video files (MKV/MP4) with matching subtitle files (SRT/VTT).
@@ -1783,40 +2286,24 @@ def remux_mkv_with_srt_batch(folder_path: Path, output_format: str = "mkv",
     success_count = 0
     total = len(video_files)
     errors = []
+    # One fresh folder listing for the whole batch instead of stat()ing each candidate
+    clear_dir_listing_cache()
     
     for idx, video_file in enumerate(video_files, start=1):
         base = video_file.stem
         # Try to find matching subtitle file (SRT or VTT)
         # First try exact match, then try without _01, _02 suffixes (LosslessCut scenes)
-        srt_file = folder_path / f"{base}.srt"
-        vtt_file = folder_path / f"{base}.vtt"
-        subtitle_file = None
-        subtitle_format = None
-        
-        if srt_file.exists():
-            subtitle_file = srt_file
-            subtitle_format = "srt"
-        elif vtt_file.exists():
-            subtitle_file = vtt_file
-            subtitle_format = "vtt"
-        else:
-            # Try without _01, _02 suffixes
-            base_clean = re.sub(r'_(\d+)$', '', base)
-            srt_file = folder_path / f"{base_clean}.srt"
-            vtt_file = folder_path / f"{base_clean}.vtt"
-            if srt_file.exists():
-                subtitle_file = srt_file
-                subtitle_format = "srt"
-            elif vtt_file.exists():
-                subtitle_file = vtt_file
-                subtitle_format = "vtt"
+        subtitle_file = find_sibling_subtitle(folder_path, base)
+        if subtitle_file is None:
+            subtitle_file = find_sibling_subtitle(folder_path, re.sub(r'_(\d+)$', '', base))
         
         if progress_callback:
             progress_callback(idx, total, video_file.name)
         
-        if not subtitle_file or not subtitle_file.exists():
+        if not subtitle_file:
             errors.append(f"{video_file.name}: no matching SRT/VTT file")
             continue
+        subtitle_format = subtitle_codec(subtitle_file)
         
         # Determine output filename
         output_ext = output_format.lower()
@@ -1840,20 +2327,13 @@ def remux_mkv_with_srt_batch(folder_path: Path, output_format: str = "mkv",
         
         # Run remux (minimal logging - only on error)
         try:
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=300
-            )
+            returncode, error_msg = run_ffmpeg_tail(cmd, timeout=300, tail_lines=10)
             
-            if result.returncode == 0 and output_file.exists():
+            if returncode == 0 and output_file.exists():
                 success_count += 1
             else:
                 # Only log errors
-                error_msg = result.stderr.split('\n')[-10:] if result.stderr else ["Unknown error"]
-                errors.append(f"{video_file.name}: {'; '.join(error_msg)}")
+                errors.append(f"{video_file.name}: {'; '.join(error_msg) or 'Unknown error'}")
         
         except subprocess.TimeoutExpired:
             errors.append(f"{video_file.name}: timeout")
@@ -1873,6 +2353,87 @@ def remux_mkv_with_srt_batch(folder_path: Path, output_format: str = "mkv",
     return success_count > 0
 
 
+# FFmpeg stderr: input duration from the header, and position from "-progress pipe:2" output
+_FFMPEG_DURATION_RE = re.compile(rb"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+_FFMPEG_OUT_TIME_RE = re.compile(rb"^out_time_(?:us|ms)=(\d+)", re.MULTILINE)  # Both are microseconds
+_FFMPEG_STDERR_TAIL_BYTES = 8192  # Raw stderr kept for the error report of a failed remux
+
+
+def get_remux_output_path(video_path: Path, output_format: str) -> Path:
+    """Get the output path used when remuxing a file with track selections."""
+    return video_path.parent / f"{video_path.stem}_remuxed.{output_format}"
+
+
+def build_remux_command(video_path: Path, output_file: Path,
+                        video_tracks: Optional[List[int]] = None, audio_tracks: Optional[List[int]] = None,
+                        subtitle_tracks: Optional[List[int]] = None, external_subtitle: Path = None,
+                        all_tracks: bool = False) -> List[str]:
+    """Build the FFmpeg command that remuxes a file with specific track selections.
+    
+    With no tracks selected every stream is kept, and a matching .srt/.vtt next to
+    the video is added when no external subtitle is given. all_tracks (every listed
+    track checked) maps all video/audio/subtitle streams by type, leaving out data
+    and attachment streams the track list never shows.
+    Note: Track IDs from analyze_tracks correspond to FFmpeg stream indices.
+    """
+    selected_tracks = [*(video_tracks or ()), *(audio_tracks or ()), *(subtitle_tracks or ())]
+    
+    subtitle_file = external_subtitle if external_subtitle and external_subtitle.exists() else None
+    if subtitle_file is None and not selected_tracks:
+        # Check for auto-detected subtitle file
+        subtitle_file = find_sibling_subtitle(video_path.parent, video_path.stem)
+    
+    if subtitle_file:
+        subtitle_format = subtitle_codec(subtitle_file)
+        subtitle_input = ("-i", str(subtitle_file))
+        codec_args = ("-map", "1:0", "-c", "copy", "-c:s", subtitle_format)
+    else:
+        subtitle_input = ()
+        codec_args = ("-c", "copy")
+    
+    # Map selected tracks (track_id from analyze_tracks is the stream index), or all of them
+    if all_tracks:
+        map_args = ["-map", "0:v?", "-map", "0:a?", "-map", "0:s?"]
+    elif selected_tracks:
+        map_args = [arg for track_id in selected_tracks for arg in ("-map", f"0:{track_id}")]
+    else:
+        map_args = ["-map", "0"]
+    
+    # Assembled in one go instead of growing the list piece by piece
+    return ["ffmpeg", "-y", "-i", str(video_path), *subtitle_input, *map_args, *codec_args, str(output_file)]
+
+
+def remux_file_with_tracks(video_path: Path, output_format: str,
+                           video_tracks: List[int], audio_tracks: List[int],
+                           subtitle_tracks: List[int], external_subtitle: Path = None,
+                           all_tracks: bool = False) -> Tuple[bool, str]:
+    """Remux a file with specific track selections.
+    
+    Touches no widgets, so it can run on a worker thread.
+    
+    Returns:
+        (success, error message or "")
+    """
+    if not video_path.exists():
+        return False, f"File not found: {video_path}"
+    
+    output_file = get_remux_output_path(video_path, output_format)
+    if output_file.exists():
+        return True, ""  # Already exists
+    
+    cmd = build_remux_command(video_path, output_file, video_tracks, audio_tracks,
+                              subtitle_tracks, external_subtitle, all_tracks)
+    
+    # Execute
+    try:
+        returncode, error_msg = run_ffmpeg_tail(cmd, timeout=300, tail_lines=5)
+        if returncode != 0:
+            return False, f"Error: {'; '.join(error_msg) or 'Unknown error'}"
+        return output_file.exists(), ""
+    except Exception as e:
+        return False, f"Error: {str(e)}"
+
+
 def transcribe_video(video_path: Path, language_code: str, model: str, whisper_options: Dict = None, output_format: str = "srt", progress_callback=None, log_callback=None) -> bool:
     """Transcribe video using whisper_auto.sh script."""
     if not video_path.exists():
@@ -1894,8 +2455,8 @@ def transcribe_video(video_path: Path, language_code: str, model: str, whisper_o
         
         # Prepare environment variables - pass user-typed extra arguments if provided
         env = os.environ.copy()
-        if whisper_options and "extra_args_parsed" in whisper_options:
-            extra_args = whisper_options.get("extra_args_parsed", "")
+        if whisper_options:
+            extra_args = parse_whisper_extra_args(whisper_options.get("extra_args", ""))
             if extra_args:
                 env["WHISPER_EXTRA_ARGS"] = extra_args
         
@@ -2101,8 +2662,8 @@ def transcribe_video_time_range(
         
         # Prepare environment variables - pass user-typed extra arguments if provided
         env = os.environ.copy()
-        if whisper_options and "extra_args_parsed" in whisper_options:
-            extra_args = whisper_options.get("extra_args_parsed", "")
+        if whisper_options:
+            extra_args = parse_whisper_extra_args(whisper_options.get("extra_args", ""))
             if extra_args:
                 env["WHISPER_EXTRA_ARGS"] = extra_args
         
@@ -2169,10 +2730,20 @@ def transcribe_video_time_range(
 # Worker Thread for Script Execution
 # ============================================================================
 
+# Worker log lines are sent to the UI in batches of up to this many lines...
+_WORKER_LOG_BATCH_LINES = 32
+# ...or after this many seconds, whichever comes first
+_WORKER_LOG_FLUSH_SECONDS = 0.05
+
+
 class ScriptWorker(QThread):
-    """Worker thread for running scripts without blocking UI."""
+    """Worker thread for running scripts without blocking UI.
+    
+    This stays a QThread rather than a pooled QRunnable: force_terminate_worker needs
+    QThread.terminate() to end a script that ignores the stop request.
+    """
     finished = pyqtSignal(bool)
-    log_message = pyqtSignal(str)
+    log_message = pyqtSignal(list)  # batch of log lines
     progress_update = pyqtSignal(int, int, str)  # current, total, filename
     
     def __init__(self, script_func, *args, **kwargs):
@@ -2181,11 +2752,37 @@ class ScriptWorker(QThread):
         self.args = args
         self.kwargs = kwargs
         self._stop_requested = False
+        self._log_pending: List[str] = []
+        self._log_lock = threading.Lock()
+        self._log_timer: Optional[threading.Timer] = None
+    
+    def _queue_log(self, msg: str):
+        """Buffer a log line; a full batch is sent at once, otherwise a timer sends it shortly."""
+        with self._log_lock:
+            self._log_pending.append(msg)
+            if len(self._log_pending) < _WORKER_LOG_BATCH_LINES:
+                if self._log_timer is None:
+                    self._log_timer = threading.Timer(_WORKER_LOG_FLUSH_SECONDS, self._flush_log)
+                    self._log_timer.daemon = True
+                    self._log_timer.start()
+                return
+        self._flush_log()
+    
+    def _flush_log(self):
+        """Emit all buffered log lines as one log_message."""
+        with self._log_lock:  # Emitting under the lock keeps batches in order
+            if self._log_timer is not None:
+                self._log_timer.cancel()
+                self._log_timer = None
+            if self._log_pending:
+                self.log_message.emit(self._log_pending)
+                self._log_pending = []
     
     def stop(self):
         """Request the worker to stop."""
         self._stop_requested = True
-        self.log_message.emit("⚠ Stop requested - cancelling operation...")
+        self._queue_log("⚠ Stop requested - cancelling operation...")
+        self._flush_log()
     
     def is_stop_requested(self):
         """Check if stop was requested."""
@@ -2195,10 +2792,15 @@ class ScriptWorker(QThread):
         """Execute the script function."""
         def log_callback(msg):
             if not self._stop_requested:
-                self.log_message.emit(msg)
+                self._queue_log(msg)
+        
+        last_progress = None
         
         def progress_callback(current, total, filename):
-            if not self._stop_requested:
+            nonlocal last_progress
+            # Scripts often repeat the same update (e.g. same Whisper percentage); only send changes
+            if not self._stop_requested and (current, total, filename) != last_progress:
+                last_progress = (current, total, filename)
                 self.progress_update.emit(current, total, filename)
         
         self.kwargs['log_callback'] = log_callback
@@ -2206,59 +2808,163 @@ class ScriptWorker(QThread):
         try:
             result = self.script_func(*self.args, **self.kwargs)
             if self._stop_requested:
-                self.log_message.emit("✗ Operation cancelled by user")
+                self._queue_log("✗ Operation cancelled by user")
+                self._flush_log()
                 self.finished.emit(False)
             else:
+                self._flush_log()
                 self.finished.emit(result)
         except Exception as e:
             if not self._stop_requested:
-                self.log_message.emit(f"Error: {e}")
+                self._queue_log(f"Error: {e}")
+            self._flush_log()
             self.finished.emit(False)
 
 
-# ============================================================================
-# Setup Checking Functions
-# ============================================================================
+class TrackProbeSignals(QObject):
+    """Signals for TrackProbeRunnable (QRunnable itself can't emit)."""
+    finished = pyqtSignal(str, object)  # video path, tracks dict from analyze_tracks
 
-def check_python_package(package_name: str) -> bool:
-    """Check if a Python package is installed."""
-    try:
-        __import__(package_name)
-        return True
-    except ImportError:
-        return False
+
+class TrackProbeRunnable(QRunnable):
+    """Thread pool task that runs analyze_tracks off the UI thread."""
+    
+    def __init__(self, video_path: Path):
+        super().__init__()
+        self.video_path = video_path
+        # Created here (UI thread) so results are delivered to the UI thread
+        self.signals = TrackProbeSignals()
+    
+    def run(self):
+        """Probe the file and emit its tracks."""
+        try:
+            tracks = analyze_tracks_cached(self.video_path)
+        except Exception as e:
+            print(f"Error analyzing tracks for {self.video_path}: {e}")
+            tracks = {'video': [], 'audio': [], 'subtitles': []}
+        self.signals.finished.emit(str(self.video_path), tracks)
 
 
-def check_command_exists(command: str) -> bool:
-    """Check if a command-line program exists."""
-    try:
-        result = subprocess.run(
-            ["which", command] if sys.platform != "win32" else ["where", command],
-            capture_output=True,
-            timeout=2
-        )
-        return result.returncode == 0
-    except Exception:
-        return False
+class VideoTypeSignals(QObject):
+    """Signals for VideoTypeRunnable."""
+    finished = pyqtSignal(str, str, object)  # video path, video type, duration in minutes (or None)
 
 
-def find_gst_command() -> Optional[str]:
-    """Find the gst command, checking PATH and common venv locations."""
-    # First try to find it in PATH
-    try:
-        result = subprocess.run(
-            ["which", "gst"],
-            capture_output=True,
-            timeout=2
-        )
-        if result.returncode == 0:
-            gst_path = result.stdout.decode().strip()
-            if gst_path and Path(gst_path).exists():
-                return gst_path
-    except Exception:
-        pass
+class VideoTypeRunnable(QRunnable):
+    """Thread pool task that runs detect_episode_or_scene off the UI thread."""
     
-    # Check common venv locations
+    def __init__(self, video_path: Path):
+        super().__init__()
+        self.video_path = video_path
+        self.signals = VideoTypeSignals()
+    
+    def run(self):
+        """Detect episode/scene and emit the result."""
+        try:
+            video_type, duration = detect_episode_or_scene(self.video_path)
+        except Exception as e:
+            print(f"Error detecting video type for {self.video_path}: {e}")
+            video_type, duration = "unknown", None
+        self.signals.finished.emit(str(self.video_path), video_type, duration)
+
+
+class RemuxSignals(QObject):
+    """Signals for RemuxRunnable."""
+    finished = pyqtSignal(str, bool, str)  # video path, success, error message
+
+
+class RemuxRunnable(QRunnable):
+    """Thread pool task that runs remux_file_with_tracks off the UI thread."""
+    
+    def __init__(self, video_path: Path, *remux_args):
+        super().__init__()
+        self.video_path = video_path
+        self.remux_args = remux_args
+        self.signals = RemuxSignals()
+    
+    def run(self):
+        """Remux the file and emit the outcome."""
+        try:
+            success, error = remux_file_with_tracks(self.video_path, *self.remux_args)
+        except Exception as e:
+            success, error = False, f"Error: {e}"
+        self.signals.finished.emit(str(self.video_path), success, error)
+
+
+class SplitChannelsSignals(QObject):
+    """Signals for SplitChannelsRunnable."""
+    finished = pyqtSignal(str, bool, object)  # video path, success, list of error messages
+
+
+class SplitChannelsRunnable(QRunnable):
+    """Thread pool task that runs split_audio_channels off the UI thread."""
+    
+    def __init__(self, video_path: Path, channel_count: int):
+        super().__init__()
+        self.video_path = video_path
+        self.channel_count = channel_count
+        self.signals = SplitChannelsSignals()
+    
+    def run(self):
+        """Split the file's channels next to it and emit the outcome."""
+        errors = []
+        
+        def collect_errors(msg):
+            if "Error" in msg or "✗" in msg:
+                errors.append(msg)
+        
+        try:
+            success = split_audio_channels(self.video_path, self.video_path.parent,
+                                           self.channel_count, collect_errors)
+        except Exception as e:
+            success = False
+            errors.append(f"Error: {e}")
+        self.signals.finished.emit(str(self.video_path), success, errors)
+
+
+# ============================================================================
+# Setup Checking Functions
+# ============================================================================
+
+def check_python_package(package_name: str) -> bool:
+    """Check if a Python package is installed."""
+    try:
+        __import__(package_name)
+        return True
+    except ImportError:
+        return False
+
+
+def check_command_exists(command: str) -> bool:
+    """Check if a command-line program exists."""
+    try:
+        result = subprocess.run(
+            ["which", command] if sys.platform != "win32" else ["where", command],
+            capture_output=True,
+            timeout=2
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+def find_gst_command() -> Optional[str]:
+    """Find the gst command, checking PATH and common venv locations."""
+    # First try to find it in PATH
+    try:
+        result = subprocess.run(
+            ["which", "gst"],
+            capture_output=True,
+            timeout=2
+        )
+        if result.returncode == 0:
+            gst_path = result.stdout.decode().strip()
+            if gst_path and Path(gst_path).exists():
+                return gst_path
+    except Exception:
+        pass
+    
+    # Check common venv locations
     possible_paths = [
         Path(__file__).parent / "venv" / "bin" / "gst",
         Path.home() / "dna" / "venv" / "bin" / "gst",
@@ -2401,7 +3107,7 @@ class SetupWizard(QDialog):
         self.setWindowTitle("Welcome to Video Processing Studio - Setup")
         self.setMinimumWidth(700)
         self.setMinimumHeight(550)
-        self.config = load_config()
+        self.config = get_config()
         self.current_step = 0
         
         # Check installation status
@@ -2695,44 +3401,30 @@ class SetupWizard(QDialog):
 # FAQ Dialog
 # ============================================================================
 
-class FAQDialog(QDialog):
-    """FAQ dialog."""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("FAQ")
-        self.setMinimumWidth(700)
-        self.setMinimumHeight(500)
-        
-        layout = QVBoxLayout()
-        
-        # FAQ content area
-        faq_content = QTextEdit()
-        faq_content.setReadOnly(True)
-        faq_content.setFont(QFont("Arial", 13))
-        faq_content.setHtml(self.get_faq_content())
-        layout.addWidget(faq_content)
-        
-        # Close button
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        button_layout.addWidget(close_btn)
-        layout.addLayout(button_layout)
-        
-        self.setLayout(layout)
-    
-    def get_faq_content(self) -> str:
-        """Generate FAQ content as HTML."""
-        return """
-        <style>
-        body { font-family: Arial, sans-serif; font-size: 13pt; line-height: 1.6; }
-        h2 { font-size: 20pt; font-weight: bold; margin-bottom: 15px; }
-        h3 { font-size: 16pt; font-weight: bold; margin-top: 20px; margin-bottom: 10px; }
-        p { font-size: 13pt; margin-bottom: 15px; }
-        b { font-weight: bold; }
-        </style>
+# Stylesheets for the FAQ/About documents, applied once per document via
+# QTextDocument.setDefaultStyleSheet() instead of inline <style> blocks
+FAQ_CSS = """
+body { font-family: Arial, sans-serif; font-size: 13pt; line-height: 1.6; }
+h2 { font-size: 20pt; font-weight: bold; margin-bottom: 15px; }
+h3 { font-size: 16pt; font-weight: bold; margin-top: 20px; margin-bottom: 10px; }
+p { font-size: 13pt; margin-bottom: 15px; }
+b { font-weight: bold; }
+"""
+
+ABOUT_CSS = """
+body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif; font-size: 13pt; line-height: 1.6; }
+.app-name { font-size: 18pt; font-weight: 600; color: #b42075; margin-bottom: 4px; }
+.version { font-size: 13pt; color: #666; margin-bottom: 16px; }
+.creator { font-size: 13pt; color: #333; margin-bottom: 20px; }
+.description { font-size: 13pt; color: #333; margin-bottom: 24px; line-height: 1.7; }
+.footer { font-size: 12pt; color: #666; font-style: italic; margin-top: 24px; }
+"""
+
+
+@functools.cache
+def _get_faq_html() -> str:
+    """Build the FAQ HTML once per process."""
+    return """
         <h2 style="color: #b42075;">Frequently Asked Questions</h2>
         
         <h3 style="color: #df4300;">Common Error Messages</h3>
@@ -2849,10 +3541,73 @@ class FAQDialog(QDialog):
         """
 
 
+class FAQDialog(QDialog):
+    """FAQ dialog."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("FAQ")
+        self.setMinimumWidth(700)
+        self.setMinimumHeight(500)
+        
+        layout = QVBoxLayout()
+        
+        # FAQ content area
+        faq_content = QTextEdit()
+        faq_content.setReadOnly(True)
+        faq_content.setUndoRedoEnabled(False)
+        faq_content.setFont(QFont("Arial", 13))
+        faq_content.document().setDefaultStyleSheet(FAQ_CSS)
+        faq_content.setHtml(self.get_faq_content())
+        layout.addWidget(faq_content)
+        
+        # Close button
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+        
+        self.setLayout(layout)
+    
+    def get_faq_content(self) -> str:
+        """Generate FAQ content as HTML."""
+        return _get_faq_html()
+
+
 # ============================================================================
 # About Dialog
 # ============================================================================
 
+@functools.cache
+def _get_about_html() -> str:
+    """Build the About HTML once per process."""
+    return f"""
+        <div style="padding: 24px;">
+        <div class="app-name">Video Processing Studio</div>
+        
+        <div class="version">Version {APP_VERSION}</div>
+        
+        <div class="creator">
+        <span style="color: #df4300; font-weight: 600;">Created by:</span> SLAPPEPOLSEN
+        </div>
+        
+        <div class="description">
+        This app wraps command-line scripts into a friendly GUI to make video processing 
+        accessible and efficient. The whole point is to make WLW / sapphic / lesbian content 
+        accessible for everyone in the world! Extracting subtitles, translating them, and 
+        processing videos with burned-in subtitles and watermarks. All with way fewer clicks.
+        </div>
+        
+        <div class="footer">
+        Built with PyQt5 and a whole lot of automation love. 
+        I love automation, and I want you to do as few clicks as possible, basically.
+        </div>
+        </div>
+        """
+
+
 class AboutDialog(QDialog):
     """About dialog."""
     
@@ -2867,7 +3622,9 @@ class AboutDialog(QDialog):
         # About content area
         about_content = QTextEdit()
         about_content.setReadOnly(True)
+        about_content.setUndoRedoEnabled(False)
         about_content.setFont(QFont("Arial", 13))
+        about_content.document().setDefaultStyleSheet(ABOUT_CSS)
         about_content.setHtml(self.get_about_content())
         layout.addWidget(about_content)
         
@@ -2906,43 +3663,33 @@ class AboutDialog(QDialog):
     
     def get_about_content(self) -> str:
         """Generate About content as HTML."""
-        return """
-        <style>
-        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif; font-size: 13pt; line-height: 1.6; }
-        .app-name { font-size: 18pt; font-weight: 600; color: #b42075; margin-bottom: 4px; }
-        .version { font-size: 13pt; color: #666; margin-bottom: 16px; }
-        .creator { font-size: 13pt; color: #333; margin-bottom: 20px; }
-        .description { font-size: 13pt; color: #333; margin-bottom: 24px; line-height: 1.7; }
-        .footer { font-size: 12pt; color: #666; font-style: italic; margin-top: 24px; }
-        </style>
-        <div style="padding: 24px;">
-        <div class="app-name">Video Processing Studio</div>
-        
-        <div class="version">Version 9.2.2</div>
-        
-        <div class="creator">
-        <span style="color: #df4300; font-weight: 600;">Created by:</span> SLAPPEPOLSEN
-        </div>
-        
-        <div class="description">
-        This app wraps command-line scripts into a friendly GUI to make video processing 
-        accessible and efficient. The whole point is to make WLW / sapphic / lesbian content 
-        accessible for everyone in the world! Extracting subtitles, translating them, and 
-        processing videos with burned-in subtitles and watermarks. All with way fewer clicks.
-        </div>
-        
-        <div class="footer">
-        Built with PyQt5 and a whole lot of automation love. 
-        I love automation, and I want you to do as few clicks as possible, basically.
-        </div>
-        </div>
-        """
+        return _get_about_html()
 
 
 # ============================================================================
 # Language Selection Dialog
 # ============================================================================
 
+# Selected languages with native names (curated list to avoid scrolling issues)
+_LANGUAGES_FULL = (
+    ("Auto-detect", "auto"),
+    ("English (English)", "en"),
+    ("French (Français)", "fr"),
+    ("Spanish (Español)", "es"),
+    ("Catalan (Català)", "ca"),
+    ("German (Deutsch)", "de"),
+    ("Italian (Italiano)", "it"),
+    ("Portuguese (Português - BR/PT)", "pt"),
+    ("Dutch (Nederlands)", "nl"),
+    ("Chinese (中文)", "zh"),
+    ("Japanese (日本語)", "ja"),
+    ("Korean (한국어)", "ko"),
+    ("Arabic (العربية)", "ar"),
+    ("Thai (ไทย)", "th"),
+    ("Greek (Ελληνικά)", "el"),
+)
+
+
 class LanguageDialog(QDialog):
     """Dialog for selecting language code for transcription."""
     
@@ -2957,30 +3704,14 @@ class LanguageDialog(QDialog):
         info_label = QLabel("Select the language of the audio/video to transcribe:")
         layout.addWidget(info_label)
         
-        # Language dropdown
+        # Language dropdown, populated from a prebuilt model in one shot
         self.language_combo = QComboBox()
-        
-        # Selected languages with native names (curated list to avoid scrolling issues)
-        languages = [
-            ("Auto-detect", "auto"),
-            ("English (English)", "en"),
-            ("French (Français)", "fr"),
-            ("Spanish (Español)", "es"),
-            ("Catalan (Català)", "ca"),
-            ("German (Deutsch)", "de"),
-            ("Italian (Italiano)", "it"),
-            ("Portuguese (Português - BR/PT)", "pt"),
-            ("Dutch (Nederlands)", "nl"),
-            ("Chinese (中文)", "zh"),
-            ("Japanese (日本語)", "ja"),
-            ("Korean (한국어)", "ko"),
-            ("Arabic (العربية)", "ar"),
-            ("Thai (ไทย)", "th"),
-            ("Greek (Ελληνικά)", "el"),
-        ]
-        
-        for name, code in languages:
-            self.language_combo.addItem(name, code)
+        model = QStandardItemModel(len(_LANGUAGES_FULL), 1, self.language_combo)
+        for i, (name, code) in enumerate(_LANGUAGES_FULL):
+            item = QStandardItem(name)
+            item.setData(code, Qt.UserRole)
+            model.setItem(i, 0, item)
+        self.language_combo.setModel(model)
         
         # Set default to English
         default_index = self.language_combo.findData("en")
@@ -3026,6 +3757,7 @@ class MediaInfoDialog(QDialog):
         # Track information
         info_text = QTextEdit()
         info_text.setReadOnly(True)
+        info_text.setUndoRedoEnabled(False)
         info_text.setFont(QFont("Courier New", 10))
         info_text.setStyleSheet("""
             QTextEdit {
@@ -3037,7 +3769,7 @@ class MediaInfoDialog(QDialog):
         
         # Analyze tracks and format info
         if video_path and video_path.exists():
-            tracks = analyze_tracks(video_path)
+            tracks = analyze_tracks_cached(video_path)
             info_lines = []
             
             # File info
@@ -3090,15 +3822,10 @@ class MediaInfoDialog(QDialog):
             else:
                 info_lines.append("\nNo embedded subtitle tracks found")
             
-            # Try to get more detailed info using ffprobe
+            # Try to get more detailed info using ffprobe (shared, cached probe)
             try:
-                result = subprocess.run(
-                    ["ffprobe", "-v", "quiet", "-print_format", "json", "-show_format", "-show_streams", str(video_path)],
-                    capture_output=True, text=True, timeout=10
-                )
-                if result.returncode == 0:
-                    import json
-                    probe_data = json.loads(result.stdout)
+                probe_data = probe_media(video_path)
+                if probe_data:
                     if 'format' in probe_data:
                         fmt = probe_data['format']
                         info_lines.append("")
@@ -3151,14 +3878,13 @@ class WhisperModelDialog(QDialog):
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
         
-        # Check if model exists in default location
-        model_exists = check_whisper_model_exists(model_name)
-        if model_exists:
-            found_label = QLabel(
-                f"✓ Found existing '{model_name}' model in default cache location."
-            )
-            found_label.setStyleSheet("color: #28a745; font-weight: bold;")
-            layout.addWidget(found_label)
+        # Placeholder for the cache check result; filled in on first show
+        self._model_name = model_name
+        self._checked = False
+        self.found_label = QLabel("")
+        self.found_label.setStyleSheet("color: #28a745; font-weight: bold;")
+        self.found_label.hide()
+        layout.addWidget(self.found_label)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -3174,6 +3900,17 @@ class WhisperModelDialog(QDialog):
         self.setLayout(layout)
         self.result = None
     
+    def showEvent(self, event):
+        """Check for an existing model in the default cache location on first show."""
+        if not self._checked:
+            self._checked = True
+            if check_whisper_model_exists(self._model_name):
+                self.found_label.setText(
+                    f"✓ Found existing '{self._model_name}' model in default cache location."
+                )
+                self.found_label.show()
+        super().showEvent(event)
+    
     def set_result(self, value: bool):
         """Set the dialog result and close."""
         self.result = value
@@ -3198,6 +3935,10 @@ class TimeRangeTranscriptionDialog(QDialog):
         
         self.video_path = None
         
+        # Cached start/end in seconds, kept in sync via timeChanged
+        self._start_s = 0
+        self._end_s = 60
+        
         layout = QVBoxLayout()
         form_layout = QFormLayout()
         
@@ -3245,14 +3986,14 @@ class TimeRangeTranscriptionDialog(QDialog):
         self.start_time = QTimeEdit()
         self.start_time.setDisplayFormat("HH:mm:ss")
         self.start_time.setTime(QTime(0, 0, 0))
-        self.start_time.timeChanged.connect(self.update_preview)
+        self.start_time.timeChanged.connect(self._on_start_changed)
         form_layout.addRow("Start Time (HH:MM:SS):", self.start_time)
         
         # End time
         self.end_time = QTimeEdit()
         self.end_time.setDisplayFormat("HH:mm:ss")
         self.end_time.setTime(QTime(0, 1, 0))  # Default 1 minute
-        self.end_time.timeChanged.connect(self.update_preview)
+        self.end_time.timeChanged.connect(self._on_end_changed)
         form_layout.addRow("End Time (HH:MM:SS):", self.end_time)
         
         # Preview label
@@ -3311,10 +4052,20 @@ class TimeRangeTranscriptionDialog(QDialog):
             self.ok_btn.setEnabled(True)
             self.update_preview()
     
+    def _on_start_changed(self, qtime: QTime):
+        """Cache the new start time in seconds and refresh the preview."""
+        self._start_s = self.time_to_seconds(qtime)
+        self.update_preview()
+    
+    def _on_end_changed(self, qtime: QTime):
+        """Cache the new end time in seconds and refresh the preview."""
+        self._end_s = self.time_to_seconds(qtime)
+        self.update_preview()
+    
     def update_preview(self):
         """Update the preview label showing duration."""
-        start_seconds = self.time_to_seconds(self.start_time.time())
-        end_seconds = self.time_to_seconds(self.end_time.time())
+        start_seconds = self._start_s
+        end_seconds = self._end_s
         
         if end_seconds > start_seconds:
             duration_seconds = end_seconds - start_seconds
@@ -3335,9 +4086,8 @@ class TimeRangeTranscriptionDialog(QDialog):
     
     def seconds_to_time_str(self, seconds: int) -> str:
         """Convert seconds to readable time string."""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
+        hours, remainder = divmod(seconds, 3600)
+        minutes, secs = divmod(remainder, 60)
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{secs:02d}"
         else:
@@ -3349,10 +4099,7 @@ class TimeRangeTranscriptionDialog(QDialog):
             QMessageBox.warning(self, "No File", "Please select a video or audio file.")
             return
         
-        start_seconds = self.time_to_seconds(self.start_time.time())
-        end_seconds = self.time_to_seconds(self.end_time.time())
-        
-        if end_seconds <= start_seconds:
+        if self._end_s <= self._start_s:
             QMessageBox.warning(
                 self, "Invalid Time Range",
                 "End time must be after start time."
@@ -3363,14 +4110,11 @@ class TimeRangeTranscriptionDialog(QDialog):
     
     def get_parameters(self) -> Dict:
         """Get the transcription parameters."""
-        start_seconds = self.time_to_seconds(self.start_time.time())
-        end_seconds = self.time_to_seconds(self.end_time.time())
-        
         return {
             "video_path": self.video_path,
             "language_code": self.language_combo.currentData(),
-            "start_time": start_seconds,
-            "end_time": end_seconds,
+            "start_time": self._start_s,
+            "end_time": self._end_s,
             "start_time_str": self.start_time.time().toString("HH:mm:ss"),
             "end_time_str": self.end_time.time().toString("HH:mm:ss"),
             "adjust_timestamps": self.adjust_timestamps_checkbox.isChecked()
@@ -3381,6 +4125,32 @@ class TimeRangeTranscriptionDialog(QDialog):
 # Settings Dialog
 # ============================================================================
 
+# Target languages offered for subtitle translation
+_TRANSLATION_LANGUAGES = ("English", "French", "Spanish", "Catalan", "German", "Italian", "Portuguese", "Dutch")
+_TRANSLATION_LANGUAGE_INDEX = {name: i for i, name in enumerate(_TRANSLATION_LANGUAGES)}
+
+# Stylesheets for the grey helper labels in the settings dialogs
+_HELP_STYLE = "color: #666;"
+_HELP_STYLE_SMALL = "color: #666; font-size: 10px;"
+_HELP_STYLE_INTRO = "color: #666; margin-bottom: 10px;"
+_HELP_STYLE_SMALL_SPACED = "color: #666; font-size: 10px; margin-bottom: 5px;"
+
+# Static help texts for SettingsDialog
+_API_KEY_INFO_HTML = (
+    'You can set up your API key safely by setting the GEMINI_API_KEY environment variable. '
+    '<a href="https://aistudio.google.com/app/apikey">Get your API key here</a> and follow the instructions '
+    'for your platform. Using the legacy API key input below is less secure, but it\'s fine if you prefer that.'
+)
+_TRANSLATION_INFO_TEXT = (
+    "Select the target language for subtitle translation. "
+    "Subtitles will be translated from their original language to your selected target."
+)
+_ISO639_HELP_TEXT = (
+    "When enabled, translated subtitles will include language codes in filenames. "
+    "This allows VLC and Jellyfin to automatically detect and select subtitles."
+)
+
+
 class SettingsDialog(QDialog):
     """Settings configuration dialog."""
     
@@ -3389,24 +4159,24 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Settings")
         self.setMinimumWidth(700)
         
-        self.config = load_config()
+        # Last enabled state applied to the watermark fields (None = not applied yet)
+        self._wm_enabled_state = None
         
+        # Build all rows with updates off so Qt does a single layout pass
+        self.setUpdatesEnabled(False)
         layout = QFormLayout()
+        layout.setRowWrapPolicy(QFormLayout.DontWrapRows)
         
         # API Key Section
-        api_key_info = QLabel(
-            'You can set up your API key safely by setting the GEMINI_API_KEY environment variable. '
-            '<a href="https://aistudio.google.com/app/apikey">Get your API key here</a> and follow the instructions '
-            'for your platform. Using the legacy API key input below is less secure, but it\'s fine if you prefer that.'
-        )
+        api_key_info = QLabel(_API_KEY_INFO_HTML)
+        api_key_info.setTextFormat(Qt.RichText)
         api_key_info.setOpenExternalLinks(True)
         api_key_info.setWordWrap(True)
-        api_key_info.setStyleSheet("color: #666;")
+        api_key_info.setStyleSheet(_HELP_STYLE)
         layout.addRow("", api_key_info)
         
         # Legacy API key input (optional, for backward compatibility)
         self.api_key_input = QLineEdit()
-        self.api_key_input.setText(self.config.get("api_key", ""))
         self.api_key_input.setEchoMode(QLineEdit.Password)
         self.api_key_input.setPlaceholderText("Optional: Legacy API key input")
         legacy_label = QLabel("API Key (Legacy):")
@@ -3414,7 +4184,6 @@ class SettingsDialog(QDialog):
         
         # Second API key input (optional, for multi-key translation)
         self.api_key2_input = QLineEdit()
-        self.api_key2_input.setText(self.config.get("api_key2", ""))
         self.api_key2_input.setEchoMode(QLineEdit.Password)
         self.api_key2_input.setPlaceholderText("Optional: Second API key for translation")
         api_key2_label = QLabel("API Key 2 (Optional):")
@@ -3422,61 +4191,42 @@ class SettingsDialog(QDialog):
         
         # Use watermarks checkbox
         self.use_watermarks_checkbox = QCheckBox("Use watermarks")
-        self.use_watermarks_checkbox.setChecked(self.config.get("use_watermarks", True))
-        self.use_watermarks_checkbox.stateChanged.connect(self.toggle_watermark_fields)
+        self.use_watermarks_checkbox.stateChanged.connect(self.toggle_watermark_fields, Qt.DirectConnection)
         layout.addRow("", self.use_watermarks_checkbox)
         
         # Watermark 720p
         self.watermark_720p_input = QLineEdit()
-        self.watermark_720p_input.setText(self.config.get("watermark_720p", ""))
         self.wm720_browse = QPushButton("Browse...")
-        self.wm720_browse.clicked.connect(lambda: self.browse_file(self.watermark_720p_input, "Select 720p Watermark"))
-        wm720_layout = QHBoxLayout()
-        wm720_layout.addWidget(self.watermark_720p_input)
-        wm720_layout.addWidget(self.wm720_browse)
-        layout.addRow("Watermark 720p:", wm720_layout)
+        self.wm720_browse.clicked.connect(self._browse_720p, Qt.DirectConnection)
+        layout.addRow("Watermark 720p:", self._build_browse_row(self.watermark_720p_input, self.wm720_browse))
         
         # Watermark 1080p
         self.watermark_1080p_input = QLineEdit()
-        self.watermark_1080p_input.setText(self.config.get("watermark_1080p", ""))
         self.wm1080_browse = QPushButton("Browse...")
-        self.wm1080_browse.clicked.connect(lambda: self.browse_file(self.watermark_1080p_input, "Select 1080p Watermark"))
-        wm1080_layout = QHBoxLayout()
-        wm1080_layout.addWidget(self.watermark_1080p_input)
-        wm1080_layout.addWidget(self.wm1080_browse)
-        layout.addRow("Watermark 1080p:", wm1080_layout)
+        self.wm1080_browse.clicked.connect(self._browse_1080p, Qt.DirectConnection)
+        layout.addRow("Watermark 1080p:", self._build_browse_row(self.watermark_1080p_input, self.wm1080_browse))
         
         # Translation Settings
         translation_section = QLabel("<b>Subtitle Translation Settings</b>")
         layout.addRow("", translation_section)
         
         # Target language for translation
-        translation_info = QLabel(
-            "Select the target language for subtitle translation. "
-            "Subtitles will be translated from their original language to your selected target."
-        )
+        translation_info = QLabel(_TRANSLATION_INFO_TEXT)
+        translation_info.setTextFormat(Qt.PlainText)
         translation_info.setWordWrap(True)
-        translation_info.setStyleSheet("color: #666;")
+        translation_info.setStyleSheet(_HELP_STYLE)
         layout.addRow("", translation_info)
         
         self.translation_target_combo = QComboBox()
-        for lang in ["English", "French", "Spanish", "Catalan", "German", "Italian", "Portuguese", "Dutch"]:
-            self.translation_target_combo.addItem(lang)
-        current_target = self.config.get("translation_target_language", "English")
-        target_index = self.translation_target_combo.findText(current_target)
-        if target_index >= 0:
-            self.translation_target_combo.setCurrentIndex(target_index)
+        self.translation_target_combo.addItems(_TRANSLATION_LANGUAGES)
         layout.addRow("Translation Target:", self.translation_target_combo)
         
         # ISO 639 suffix checkbox
         self.iso639_checkbox = QCheckBox("Use ISO 639 language suffixes (.eng.srt, .fra.srt)")
-        self.iso639_checkbox.setChecked(self.config.get("use_iso639_suffixes", False))
-        iso639_help = QLabel(
-            "When enabled, translated subtitles will include language codes in filenames. "
-            "This allows VLC and Jellyfin to automatically detect and select subtitles."
-        )
+        iso639_help = QLabel(_ISO639_HELP_TEXT)
+        iso639_help.setTextFormat(Qt.PlainText)
         iso639_help.setWordWrap(True)
-        iso639_help.setStyleSheet("color: #666; font-size: 10px;")
+        iso639_help.setStyleSheet(_HELP_STYLE_SMALL)
         iso639_layout = QVBoxLayout()
         iso639_layout.addWidget(self.iso639_checkbox)
         iso639_layout.addWidget(iso639_help)
@@ -3485,31 +4235,58 @@ class SettingsDialog(QDialog):
         # Lesbian Flag theme toggle (joke feature - doesn't actually turn off)
         self.lesbian_flag_checkbox = QCheckBox("Toggle Lesbian Flag theme OFF")
         self.lesbian_flag_checkbox.setChecked(False)  # Always unchecked (meaning theme is ON)
-        self.lesbian_flag_checkbox.stateChanged.connect(self.toggle_lesbian_flag_theme)
+        self.lesbian_flag_checkbox.stateChanged.connect(self.toggle_lesbian_flag_theme, Qt.DirectConnection)
         layout.addRow("", self.lesbian_flag_checkbox)
         
-        # Set initial state
-        self.toggle_watermark_fields()
-        
         # Buttons
         button_layout = QHBoxLayout()
         save_btn = QPushButton("Save")
-        save_btn.clicked.connect(self.save_settings)
+        save_btn.clicked.connect(self.save_settings, Qt.DirectConnection)
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
+        cancel_btn.clicked.connect(self.reject, Qt.DirectConnection)
         button_layout.addWidget(save_btn)
         button_layout.addWidget(cancel_btn)
         layout.addRow(button_layout)
         
         self.setLayout(layout)
+        self.setUpdatesEnabled(True)
+        
+        # Fill fields from config and set initial state
+        self.reload_from_config()
+    
+    def reload_from_config(self):
+        """Refresh field values from the current config without rebuilding widgets."""
+        self.config = get_config()
+        self.api_key_input.setText(self.config.get("api_key", ""))
+        self.api_key2_input.setText(self.config.get("api_key2", ""))
+        self.use_watermarks_checkbox.setChecked(self.config.get("use_watermarks", True))
+        self.watermark_720p_input.setText(self.config.get("watermark_720p", ""))
+        self.watermark_1080p_input.setText(self.config.get("watermark_1080p", ""))
+        current_target = self.config.get("translation_target_language", "English")
+        target_index = _TRANSLATION_LANGUAGE_INDEX.get(current_target)
+        if target_index is not None:
+            self.translation_target_combo.setCurrentIndex(target_index)
+        self.iso639_checkbox.setChecked(self.config.get("use_iso639_suffixes", False))
+        self.toggle_watermark_fields()
+    
+    def _build_browse_row(self, line_edit, button):
+        """Wrap a path field and its Browse button in a single margin-free row widget."""
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.addWidget(line_edit)
+        row_layout.addWidget(button)
+        return row
     
     def toggle_watermark_fields(self):
         """Enable/disable watermark input fields based on checkbox."""
         enabled = self.use_watermarks_checkbox.isChecked()
-        self.watermark_720p_input.setEnabled(enabled)
-        self.watermark_1080p_input.setEnabled(enabled)
-        self.wm720_browse.setEnabled(enabled)
-        self.wm1080_browse.setEnabled(enabled)
+        if enabled == self._wm_enabled_state:
+            return
+        self._wm_enabled_state = enabled
+        for widget in (self.watermark_720p_input, self.watermark_1080p_input,
+                       self.wm720_browse, self.wm1080_browse):
+            widget.setEnabled(enabled)
     
     def toggle_lesbian_flag_theme(self, state):
         """Joke feature - shows a message and keeps the theme ON."""
@@ -3520,10 +4297,14 @@ class SettingsDialog(QDialog):
                 "Wait a minute...",
                 "That kinda homophobic, isn't it?"
             )
-            # Immediately uncheck it (keep theme ON)
-            self.lesbian_flag_checkbox.blockSignals(True)
-            self.lesbian_flag_checkbox.setChecked(False)
-            self.lesbian_flag_checkbox.blockSignals(False)
+            # Uncheck it once the message box has unwound (keep theme ON)
+            QTimer.singleShot(0, self._uncheck_lesbian_flag)
+    
+    def _uncheck_lesbian_flag(self):
+        """Reset the lesbian flag checkbox without re-triggering the joke."""
+        self.lesbian_flag_checkbox.blockSignals(True)
+        self.lesbian_flag_checkbox.setChecked(False)
+        self.lesbian_flag_checkbox.blockSignals(False)
     
     def browse_file(self, line_edit, title):
         """Browse for a file."""
@@ -3533,15 +4314,25 @@ class SettingsDialog(QDialog):
         if file_path:
             line_edit.setText(file_path)
     
+    def _browse_720p(self):
+        """Browse for the 720p watermark file."""
+        self.browse_file(self.watermark_720p_input, "Select 720p Watermark")
+    
+    def _browse_1080p(self):
+        """Browse for the 1080p watermark file."""
+        self.browse_file(self.watermark_1080p_input, "Select 1080p Watermark")
+    
     def save_settings(self):
         """Save settings and close dialog."""
-        self.config["api_key"] = self.api_key_input.text()
-        self.config["api_key2"] = self.api_key2_input.text()
-        self.config["watermark_720p"] = self.watermark_720p_input.text()
-        self.config["watermark_1080p"] = self.watermark_1080p_input.text()
-        self.config["use_watermarks"] = self.use_watermarks_checkbox.isChecked()
-        self.config["translation_target_language"] = self.translation_target_combo.currentText()
-        self.config["use_iso639_suffixes"] = self.iso639_checkbox.isChecked()
+        self.config.update({
+            "api_key": self.api_key_input.text(),
+            "api_key2": self.api_key2_input.text(),
+            "watermark_720p": self.watermark_720p_input.text(),
+            "watermark_1080p": self.watermark_1080p_input.text(),
+            "use_watermarks": self.use_watermarks_checkbox.isChecked(),
+            "translation_target_language": self.translation_target_combo.currentText(),
+            "use_iso639_suffixes": self.iso639_checkbox.isChecked(),
+        })
         save_config(self.config)
         self.accept()
 
@@ -3550,79 +4341,8 @@ class SettingsDialog(QDialog):
 # Whisper Options Dialog (Standalone)
 # ============================================================================
 
-class WhisperOptionsDialog(QDialog):
-    """Simplified dialog for Whisper advanced options - manual parameter entry."""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Whisper Advanced Options")
-        self.setMinimumWidth(1000)
-        self.setMinimumHeight(700)
-        
-        self.config = load_config()
-        
-        main_layout = QVBoxLayout()
-        
-        # Info label
-        info_label = QLabel("Type additional Whisper parameters below. These will be appended to the default command.")
-        info_label.setStyleSheet("color: #666; margin-bottom: 10px;")
-        info_label.setWordWrap(True)
-        main_layout.addWidget(info_label)
-        
-        # Split layout: left panel (parameters reference) and right panel (user input)
-        split_layout = QHBoxLayout()
-        
-        # Left panel: Available Parameters (read-only reference)
-        left_panel = QGroupBox("Available Parameters (Reference)")
-        left_layout = QVBoxLayout()
-        
-        params_text = QTextEdit()
-        params_text.setReadOnly(True)
-        params_text.setFont(QFont("Courier New", 10))
-        params_text.setPlainText(self.get_parameters_reference())
-        left_layout.addWidget(params_text)
-        
-        left_panel.setLayout(left_layout)
-        split_layout.addWidget(left_panel, 1)  # 1:1 ratio
-        
-        # Right panel: Additional Parameters (user input)
-        right_panel = QGroupBox("Additional Parameters")
-        right_layout = QVBoxLayout()
-        
-        help_label = QLabel("Enter one parameter per line. Format: --parameter_name value\nExample:\n--patience 1.0\n--word_timestamps True\n--max_words_per_line 7")
-        help_label.setStyleSheet("color: #666; font-size: 10px; margin-bottom: 5px;")
-        help_label.setWordWrap(True)
-        right_layout.addWidget(help_label)
-        
-        self.extra_args_input = QTextEdit()
-        self.extra_args_input.setFont(QFont("Courier New", 11))
-        self.extra_args_input.setPlaceholderText("--patience 1.0\n--word_timestamps True\n--max_words_per_line 7\n--max_line_count 2")
-        # Load existing extra_args from config
-        extra_args = self.config.get("whisper_options", {}).get("extra_args", "")
-        self.extra_args_input.setPlainText(extra_args)
-        right_layout.addWidget(self.extra_args_input)
-        
-        right_panel.setLayout(right_layout)
-        split_layout.addWidget(right_panel, 1)  # 1:1 ratio
-        
-        main_layout.addLayout(split_layout)
-        
-        # Buttons at bottom
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-        save_btn = QPushButton("Save")
-        save_btn.clicked.connect(self.save_settings)
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(save_btn)
-        button_layout.addWidget(cancel_btn)
-        main_layout.addLayout(button_layout)
-        
-        self.setLayout(main_layout)
-    
-    def get_parameters_reference(self) -> str:
-        """Generate reference text listing all available Whisper parameters."""
-        params = """--model : name of the Whisper model to use (default: turbo), selects model size; larger = more accurate but slower, smaller = faster but less accurate
+# Read-only reference of Whisper CLI parameters shown in WhisperOptionsDialog
+_WHISPER_PARAMETERS_REFERENCE = """--model : name of the Whisper model to use (default: turbo), selects model size; larger = more accurate but slower, smaller = faster but less accurate
 
 --model_dir : path to save model files (default: ~/.cache/whisper), folder where downloaded models are stored
 
@@ -3683,23 +4403,109 @@ class WhisperOptionsDialog(QDialog):
 --hallucination_silence_threshold : skip silent periods when hallucination detected (requires word_timestamps) (default: None), avoids fake text (the so-called "hallucination") during silences
 
 Note: --language and --task translate are handled by the main tab and should not be included here."""
-        return params
+
+
+class WhisperOptionsDialog(QDialog):
+    """Simplified dialog for Whisper advanced options - manual parameter entry."""
+    
+    # Monospace fonts shared by every instance (created on first use)
+    _MONO_FONT_10 = None
+    _MONO_FONT_11 = None
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        if WhisperOptionsDialog._MONO_FONT_10 is None:
+            WhisperOptionsDialog._MONO_FONT_10 = QFont("Courier New", 10)
+            WhisperOptionsDialog._MONO_FONT_11 = QFont("Courier New", 11)
+        self.setWindowTitle("Whisper Advanced Options")
+        self.setMinimumWidth(1000)
+        self.setMinimumHeight(700)
+        
+        main_layout = QVBoxLayout()
+        
+        # Info label
+        info_label = QLabel("Type additional Whisper parameters below. These will be appended to the default command.")
+        info_label.setStyleSheet(_HELP_STYLE_INTRO)
+        info_label.setWordWrap(True)
+        main_layout.addWidget(info_label)
+        
+        # Split layout: left panel (parameters reference) and right panel (user input)
+        split_layout = QHBoxLayout()
+        
+        # Left panel: Available Parameters (read-only reference)
+        left_panel = QGroupBox("Available Parameters (Reference)")
+        left_layout = QVBoxLayout()
+        
+        # Font and text are filled in on first show (see showEvent)
+        self.params_text = QTextEdit()
+        self.params_text.setReadOnly(True)
+        self._ref_populated = False
+        left_layout.addWidget(self.params_text)
+        
+        left_panel.setLayout(left_layout)
+        split_layout.addWidget(left_panel, 1)  # 1:1 ratio
+        
+        # Right panel: Additional Parameters (user input)
+        right_panel = QGroupBox("Additional Parameters")
+        right_layout = QVBoxLayout()
+        
+        help_label = QLabel("Enter one parameter per line. Format: --parameter_name value\nExample:\n--patience 1.0\n--word_timestamps True\n--max_words_per_line 7")
+        help_label.setStyleSheet(_HELP_STYLE_SMALL_SPACED)
+        help_label.setWordWrap(True)
+        right_layout.addWidget(help_label)
+        
+        self.extra_args_input = QTextEdit()
+        self.extra_args_input.setFont(self._MONO_FONT_11)
+        self.extra_args_input.setPlaceholderText("--patience 1.0\n--word_timestamps True\n--max_words_per_line 7\n--max_line_count 2")
+        right_layout.addWidget(self.extra_args_input)
+        
+        right_panel.setLayout(right_layout)
+        split_layout.addWidget(right_panel, 1)  # 1:1 ratio
+        
+        main_layout.addLayout(split_layout)
+        
+        # Buttons at bottom
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        save_btn = QPushButton("Save")
+        save_btn.clicked.connect(self.save_settings)
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(save_btn)
+        button_layout.addWidget(cancel_btn)
+        main_layout.addLayout(button_layout)
+        
+        self.setLayout(main_layout)
+        
+        # Load existing extra_args from config
+        self.reload_from_config()
+    
+    def showEvent(self, event):
+        """Populate the parameters reference the first time the dialog is shown."""
+        if not self._ref_populated:
+            self.params_text.setFont(self._MONO_FONT_10)
+            self.params_text.setPlainText(_WHISPER_PARAMETERS_REFERENCE)
+            self._ref_populated = True
+        super().showEvent(event)
+    
+    def reload_from_config(self):
+        """Refresh the extra arguments field from the current config."""
+        self.config = get_config()
+        extra_args = self.config.get("whisper_options", {}).get("extra_args", "")
+        self.extra_args_input.setPlainText(extra_args)
     
     def save_settings(self):
         """Save whisper options and close dialog."""
         # Get user-typed parameters (one per line)
         extra_args_text = self.extra_args_input.toPlainText().strip()
         
-        # Convert newlines to spaces for WHISPER_EXTRA_ARGS
-        # This allows users to type one parameter per line for readability
-        extra_args = " ".join(line.strip() for line in extra_args_text.split("\n") if line.strip())
-        
-        # Save to config
+        # Save to config as multiline for display; the argument list for
+        # WHISPER_EXTRA_ARGS is derived (and memoized) when transcribing (parse_whisper_extra_args)
         if "whisper_options" not in self.config:
             self.config["whisper_options"] = {}
         
-        self.config["whisper_options"]["extra_args"] = extra_args_text  # Save as multiline for display
-        self.config["whisper_options"]["extra_args_parsed"] = extra_args  # Save as space-separated for script
+        self.config["whisper_options"]["extra_args"] = extra_args_text
+        self.config["whisper_options"].pop("extra_args_parsed", None)  # Drop legacy duplicate
         
         save_config(self.config)
         self.accept()
@@ -3709,14 +4515,253 @@ Note: --language and --task translate are handled by the main tab and should not
 # Main Window
 # ============================================================================
 
+@functools.lru_cache(maxsize=64)
+def _darken_color(hex_color: str, percent: float = 0.15) -> str:
+    """Darken a hex color by a percentage."""
+    # Parse #rrggbb once and pull the channels out with shifts
+    value = int(hex_color.lstrip('#'), 16)
+    factor = 1 - percent
+    r = int(((value >> 16) & 0xFF) * factor)
+    g = int(((value >> 8) & 0xFF) * factor)
+    b = int((value & 0xFF) * factor)
+    return f"#{(r << 16) | (g << 8) | b:06x}"
+
+
+@functools.lru_cache(maxsize=32)
+def _button_stylesheet(color: str, selector: str = "QPushButton", hover_color: str = None) -> str:
+    """Build the solid color button stylesheet (15% darker hover), once per color."""
+    if hover_color is None:
+        hover_color = _darken_color(color, 0.15)
+    return f"""
+        {selector} {{
+            background-color: {color};
+            color: white;
+            border: none;
+            border-radius: 5px;
+            padding: 4px 12px;
+            font-weight: bold;
+            min-height: 18px;
+            outline: none;
+        }}
+        {selector}:hover {{
+            background-color: {hover_color};
+            border: none;
+            outline: none;
+        }}
+        {selector}:pressed {{
+            background-color: {hover_color};
+            border: none;
+            outline: none;
+        }}
+        """
+
+
+# Progress bar chunk color per operation (current_operation); Red is the fallback
+_PROGRESS_BAR_COLORS = {
+    "Downloading episodes": "#df4300",  # Red
+    "Extracting subtitles": "#f48a32",  # Orange
+    "Cleaning subtitles": "#f48a32",  # Orange
+    "Translating subtitles": "#ffab68",  # Light Orange
+    "Processing videos": "#dc7bb3",  # Pink
+    "Remuxing videos": "#c46ea1",  # Purple
+    "Transcribing video": "#b42075",  # Dark Pink
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _progress_bar_stylesheet(color: str) -> str:
+    """Build the progress bar stylesheet for a chunk color, once per color."""
+    return f"""
+            QProgressBar {{
+                border: 1px solid #ccc;
+                border-radius: 5px;
+                text-align: center;
+                background-color: #f0f0f0;
+                font-weight: bold;
+            }}
+            QProgressBar::chunk {{
+                background-color: {color};
+                border-radius: 4px;
+            }}
+        """
+
+
+# Lesbian flag colors per button group: Red → Orange → Light Orange → Pink → Purple → Dark Pink
+_BUTTON_GROUP_COLORS = {
+    "download": "#df4300",    # Red
+    "subtitles": "#f48a32",   # Orange
+    "process": "#ffab68",     # Light Orange
+    "remux": "#dc7bb3",       # Pink
+    "transcribe": "#c46ea1",  # Purple
+    "top": "#b42075",         # Dark Pink (Settings, FAQ, About)
+}
+
+
+# Red Stop button shared by the main progress area and the Transcription tab
+_STOP_BUTTON_QSS = """
+        QPushButton[role="stop"] {
+            background-color: #cc0000;
+            color: white;
+            border: none;
+            border-radius: 5px;
+            padding: 4px 12px;
+            font-weight: bold;
+        }
+        QPushButton[role="stop"]:hover {
+            background-color: #990000;
+        }
+        QPushButton[role="stop"]:pressed {
+            background-color: #660000;
+        }
+        QPushButton[role="stop"]:disabled {
+            background-color: #cccccc;
+            color: #666666;
+        }
+        """
+
+# Application-wide stylesheet, applied once in init_ui. Widgets opt in through
+# their object name or a "group"/"role" dynamic property instead of each
+# carrying its own setStyleSheet call.
+# The flag buttons deliberately stay here rather than on QPalette: Fusion draws
+# palette Button colors as a bevelled gradient with its own frame, so the rounded
+# corners, padding and flat borderless fill need the stylesheet, and the :hover /
+# :pressed colors come with it for free (a palette would need an event filter).
+APP_QSS = "".join(
+    _button_stylesheet(color, f'QPushButton[group="{group}"]')
+    for group, color in _BUTTON_GROUP_COLORS.items()
+) + _STOP_BUTTON_QSS + """
+        QLabel[role="hint"] {
+            color: #666;
+            font-size: 10px;
+        }
+        QGroupBox[role="section"] {
+            font-weight: bold;
+        }
+        """
+
+# Rules used only inside the lazily built Transcription / Remuxing tabs; each is
+# applied once to its tab after the tab's widget tree is complete
+_TRANSCRIBE_TAB_QSS = _button_stylesheet("#d168a3", "QPushButton#transcribeMain", "#b1588a") + """
+        QPlainTextEdit#transcribeLog {
+            background-color: #f5f5f5;
+            border: 1px solid #ddd;
+            border-radius: 3px;
+            font-family: 'Courier New', 'Menlo',monospace;
+            font-size: 11px;
+        }
+        QProgressBar#transcribeBar {
+            border: 1px solid #ccc;
+            border-radius: 5px;
+            text-align: center;
+            background-color: #f0f0f0;
+        }
+        QProgressBar#transcribeBar::chunk {
+            background-color: #5dade2;
+            border-radius: 4px;
+        }
+        """
+_REMUX_TAB_QSS = """
+        QTreeWidget#remuxFilesTree {
+            background-color: #f5f5f5;
+            border: 1px solid #ddd;
+            border-radius: 3px;
+            font-size: 11px;
+        }
+        QTreeWidget#remuxFilesTree::item {
+            padding: 3px;
+        }
+        QTreeWidget#remuxFilesTree::item:selected {
+            background-color: #d168a3;
+            color: white;
+        }
+        QLineEdit#remuxStatus {
+            background-color: #f5f5f5;
+            border: 1px solid #ddd;
+            border-radius: 3px;
+            padding: 5px;
+            font-size: 11px;
+        }
+        """
+
+# Transcription tab combo contents: (label, data) pairs and model names
+_TRANSCRIBE_LANGUAGES = (
+    ("Auto-detect", "auto"),
+    ("English (English)", "en"),
+    ("French (Français)", "fr"),
+    ("Spanish (Español)", "es"),
+    ("Catalan (Català)", "ca"),
+    ("German (Deutsch)", "de"),
+    ("Italian (Italiano)", "it"),
+    ("Portuguese (Português)", "pt"),
+    ("Dutch (Nederlands)", "nl"),
+    ("Chinese (中文)", "zh"),
+    ("Japanese (日本語)", "ja"),
+    ("Korean (한국어)", "ko"),
+)
+_WHISPER_OUTPUT_FORMATS = (
+    ("SRT (Subtitles)", "srt"),
+    ("VTT (WebVTT)", "vtt"),
+    ("TXT (Plain Text)", "txt"),
+    ("TSV (Tab-Separated)", "tsv"),
+    ("JSON (Detailed)", "json"),
+    ("All Formats", "all"),
+)
+_WHISPER_MODELS = ("tiny", "base", "small", "medium", "large", "turbo")
+
+# Maximum number of lines kept in plain text log views
+_LOG_MAX_BLOCKS = 2000
+# Main log lines are buffered and appended together at most this often
+_LOG_FLUSH_INTERVAL_MS = 100
+# The main log keeps following new lines while scrolled within this many lines of the end
+_LOG_FOLLOW_TOLERANCE_LINES = 4
+# After a forced terminate, check this often (and this many times) whether the worker thread is gone
+_TERMINATE_POLL_MS = 100
+_TERMINATE_POLL_ATTEMPTS = 30
+# Per-file percentage appended to progress filenames, e.g. "video.mp4 (45.2%)"
+_PROGRESS_PERCENT_RE = re.compile(r'\((\d+\.?\d*)%\)$')
+
+
 class VideoProcessingApp(QMainWindow):
     """Main application window."""
     
+    # Tab header/section fonts shared by every tab (created on first use)
+    _HEADER_FONT = None
+    _BOLD10_FONT = None
+    
     def __init__(self):
         super().__init__()
-        self.config = load_config()
+        if VideoProcessingApp._HEADER_FONT is None:
+            VideoProcessingApp._HEADER_FONT = QFont("Arial", 14, QFont.Bold)
+            VideoProcessingApp._BOLD10_FONT = QFont("Arial", 10, QFont.Bold)
+        self.config = get_config()  # Reads the file once; dialogs reuse the cached copy
         self.worker = None
+        self._stuck_workers = []  # Terminated workers whose thread never ended; a QThread must outlive its thread
+        self._last_progress_state = None  # (percent, current, total, filename) last shown by on_progress_update
         self.remux_selected_files = []  # Initialize selected files list
+        self._track_probe_signals = set()  # Signals of in-flight TrackProbeRunnables
+        self._video_type_signals = set()  # Signals of in-flight VideoTypeRunnables
+        self._track_probe_paths = set()  # str(path) of files with a TrackProbeRunnable in flight
+        # Remux tab batches (remux, channel split) run one ffmpeg per CPU;
+        # _remux_batch/_split_batch hold progress counters while one runs
+        self._remux_pool = QThreadPool(self)
+        self._remux_pool.setMaxThreadCount(os.cpu_count() or 1)
+        self._remux_signals = set()
+        self._remux_batch = None
+        self._split_batch = None
+        self._remux_processes = {}  # str(path) -> state of a running single-file remux QProcess
+        # str(path) of every file being remuxed, by a QProcess or a batch, so the two never overlap
+        self._remux_in_flight = set()
+        # Flag color group -> buttons, filled by _make_button while building the UI
+        self._button_groups: Dict[str, List[QPushButton]] = defaultdict(list)
+        # Settings/Whisper dialogs are built on first open and reused afterwards
+        self._settings_dialog = None
+        self._whisper_dialog = None
+        # Lines for the main log wait here until _flush_log appends them in one go
+        self._log_buffer: List[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(_LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         
         # Set window icon
         self.setWindowIcon(get_app_icon())
@@ -3725,135 +4770,63 @@ class VideoProcessingApp(QMainWindow):
         if not self.config.get("setup_complete", False):
             wizard = SetupWizard(self)
             wizard.exec_()
+            # The wizard saved its own copy; later saves from this window must start from it
+            self.config = get_config()
         
         self.init_ui()
     
     def darken_color(self, hex_color: str, percent: float = 0.15) -> str:
         """Darken a hex color by a percentage."""
-        # Remove # if present
-        hex_color = hex_color.lstrip('#')
-        # Convert to RGB
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        # Darken by percent
-        r = max(0, int(r * (1 - percent)))
-        g = max(0, int(g * (1 - percent)))
-        b = max(0, int(b * (1 - percent)))
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
-    
-    def apply_button_style(self, button: QPushButton, color: str):
-        """Apply solid color style to a button with 15% darker hover."""
-        hover_color = self.darken_color(color, 0.15)
-        stylesheet = f"""
-        QPushButton {{
-            background-color: {color};
-            color: white;
-            border: none;
-            border-radius: 5px;
-            padding: 4px 12px;
-            font-weight: bold;
-            min-height: 18px;
-            outline: none;
-        }}
-        QPushButton:hover {{
-            background-color: {hover_color};
-            border: none;
-            outline: none;
-        }}
-        QPushButton:pressed {{
-            background-color: {hover_color};
-            border: none;
-            outline: none;
-        }}
-        """
-        button.setStyleSheet(stylesheet)
+        return _darken_color(hex_color, percent)
+    
+    def _set_text_color(self, widget: QWidget, color: str):
+        """Set a plain text color through the palette (no stylesheet parse or match)."""
+        palette = widget.palette()
+        palette.setColor(QPalette.WindowText, QColor(color))
+        widget.setPalette(palette)
+    
+    def _make_button(self, text: str, group: str) -> QPushButton:
+        """Create a button and record it under its flag color group."""
+        btn = QPushButton(text)
+        self._button_groups[group].append(btn)
+        return btn
     
     def apply_lesbian_flag_styles(self):
-        """Apply lesbian flag color scheme to buttons."""
-        # Lesbian flag colors: Red → Orange → Light Orange → Pink → Purple → Dark Pink
-        colors = [
-            "#df4300",  # Red
-            "#f48a32",  # Orange
-            "#ffab68",  # Light Orange
-            "#dc7bb3",  # Pink
-            "#c46ea1",  # Purple
-            "#b42075",  # Dark Pink
-        ]
-        
-        # Find all buttons and apply colors by section
-        # We'll need to store button references or find them by their parent group
-        # For now, let's apply styles directly to buttons we can identify
-        
-        # Get all QPushButton widgets
-        buttons = self.findChildren(QPushButton)
-        
-        # Group buttons by their parent QGroupBox
-        download_buttons = []
-        subtitle_buttons = []
-        process_buttons = []
-        remux_buttons = []
-        transcribe_buttons = []
-        settings_button = None
-        faq_button = None
-        about_button = None
-        
-        for btn in buttons:
-            parent = btn.parent()
-            # Walk up the parent chain to find QGroupBox
-            while parent:
-                if isinstance(parent, QGroupBox):
-                    group_title = parent.title()
-                    if group_title == "DOWNLOAD":
-                        download_buttons.append(btn)
-                    elif group_title == "SUBTITLES":
-                        subtitle_buttons.append(btn)
-                    elif group_title == "PROCESS VIDEO":
-                        process_buttons.append(btn)
-                    elif group_title == "REMUX":
-                        remux_buttons.append(btn)
-                    elif group_title == "TRANSCRIBE":
-                        transcribe_buttons.append(btn)
-                    break
-                parent = parent.parent()
-            
-            # Settings, FAQ, and About buttons are in top bar, not in a group
-            if btn.text() == "Settings":
-                settings_button = btn
-            elif btn.text() == "FAQ":
-                faq_button = btn
-            elif btn.text() == "About":
-                about_button = btn
-        
-        # Apply colors to each group
-        # Group 1: Download buttons - Red
-        for btn in download_buttons:
-            self.apply_button_style(btn, colors[0])
-        
-        # Group 2: Subtitles buttons - Orange
-        for btn in subtitle_buttons:
-            self.apply_button_style(btn, colors[1])
-        
-        # Group 3: Process video buttons - Light Orange
-        for btn in process_buttons:
-            self.apply_button_style(btn, colors[2])
-        
-        # Group 4: Remux buttons - Pink
-        for btn in remux_buttons:
-            self.apply_button_style(btn, colors[3])
-        
-        # Group 5: Transcribe button - Purple
-        for btn in transcribe_buttons:
-            self.apply_button_style(btn, colors[4])
-        
-        # Settings, FAQ, and About buttons - Dark Pink
-        if settings_button:
-            self.apply_button_style(settings_button, colors[5])
-        if faq_button:
-            self.apply_button_style(faq_button, colors[5])
-        if about_button:
-            self.apply_button_style(about_button, colors[5])
+        """Apply lesbian flag color scheme to buttons (colors in _BUTTON_GROUP_COLORS)."""
+        # Buttons were recorded by group in _make_button; colors come from the matching APP_QSS rule.
+        # Tag them all with updates off so Qt repolishes and repaints once at the end.
+        self.setUpdatesEnabled(False)
+        try:
+            for group, buttons in self._button_groups.items():
+                for btn in buttons:
+                    btn.setProperty("group", group)
+                    # Dynamic property selectors are only re-evaluated on polish
+                    btn.style().unpolish(btn)
+                    btn.style().polish(btn)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
+    
+    def build_lazy_tab(self, index: int):
+        """Build a deferred tab's contents the first time it is shown."""
+        builder = self._lazy_tab_builders.pop(index, None)
+        if builder is None:
+            return
+        self.main_tabs.widget(index).layout().addWidget(builder())
+        if not self._lazy_tab_builders:
+            # Every deferred tab exists now; later tab switches need no check
+            self.main_tabs.currentChanged.disconnect(self.build_lazy_tab)
+    
+    def _fill_combo(self, combo: QComboBox, entries):
+        """Fill a combo with (label, data) pairs from a prebuilt model in one reset."""
+        model = QStandardItemModel(len(entries), 1, combo)
+        for i, (name, code) in enumerate(entries):
+            item = QStandardItem(name)
+            item.setData(code, Qt.UserRole)
+            model.setItem(i, 0, item)
+        combo.blockSignals(True)
+        combo.setModel(model)
+        combo.blockSignals(False)
     
     def create_transcription_tab(self):
         """Create the dedicated transcription tab."""
@@ -3863,11 +4836,11 @@ class VideoProcessingApp(QMainWindow):
         
         # Header
         header_label = QLabel("Transcribe Audio/Video to Subtitles")
-        header_label.setFont(QFont("Arial", 14, QFont.Bold))
+        header_label.setFont(self._HEADER_FONT)
         layout.addWidget(header_label)
         
         desc_label = QLabel("Use OpenAI Whisper to generate subtitles from audio/video")
-        desc_label.setStyleSheet("color: #666;")
+        self._set_text_color(desc_label, "#666")
         layout.addWidget(desc_label)
         
         # File selection
@@ -3883,29 +4856,14 @@ class VideoProcessingApp(QMainWindow):
         browse_btn.clicked.connect(self.browse_transcribe_file)
         file_row.addWidget(file_label, 0)
         file_row.addWidget(self.transcribe_file_input, 1)
-        file_row.addWidget(browse_btn, 0)
-        file_layout.addLayout(file_row)
-        
-        # Language selection
-        lang_row = QHBoxLayout()
-        lang_label = QLabel("Language:")
-        self.transcribe_language_combo = QComboBox()
-        languages = [
-            ("Auto-detect", "auto"),
-            ("English (English)", "en"),
-            ("French (Français)", "fr"),
-            ("Spanish (Español)", "es"),
-            ("Catalan (Català)", "ca"),
-            ("German (Deutsch)", "de"),
-            ("Italian (Italiano)", "it"),
-            ("Portuguese (Português)", "pt"),
-            ("Dutch (Nederlands)", "nl"),
-            ("Chinese (中文)", "zh"),
-            ("Japanese (日本語)", "ja"),
-            ("Korean (한국어)", "ko"),
-        ]
-        for name, code in languages:
-            self.transcribe_language_combo.addItem(name, code)
+        file_row.addWidget(browse_btn, 0)
+        file_layout.addLayout(file_row)
+        
+        # Language selection
+        lang_row = QHBoxLayout()
+        lang_label = QLabel("Language:")
+        self.transcribe_language_combo = QComboBox()
+        self._fill_combo(self.transcribe_language_combo, _TRANSCRIBE_LANGUAGES)
         lang_row.addWidget(lang_label, 0)
         lang_row.addWidget(self.transcribe_language_combo, 1)
         lang_row.addStretch()
@@ -3916,16 +4874,7 @@ class VideoProcessingApp(QMainWindow):
         format_label = QLabel("Output Format:")
         format_label.setFixedWidth(120)
         self.transcribe_format_combo = QComboBox()
-        formats = [
-            ("SRT (Subtitles)", "srt"),
-            ("VTT (WebVTT)", "vtt"),
-            ("TXT (Plain Text)", "txt"),
-            ("TSV (Tab-Separated)", "tsv"),
-            ("JSON (Detailed)", "json"),
-            ("All Formats", "all"),
-        ]
-        for name, code in formats:
-            self.transcribe_format_combo.addItem(name, code)
+        self._fill_combo(self.transcribe_format_combo, _WHISPER_OUTPUT_FORMATS)
         # Default to SRT
         default_format = self.config.get("whisper_output_format", "srt")
         format_index = self.transcribe_format_combo.findData(default_format)
@@ -3941,7 +4890,7 @@ class VideoProcessingApp(QMainWindow):
         model_label = QLabel("Whisper Model:")
         model_label.setFixedWidth(120)
         self.transcribe_model_combo = QComboBox()
-        self.transcribe_model_combo.addItems(["tiny", "base", "small", "medium", "large", "turbo"])
+        self._fill_combo(self.transcribe_model_combo, [(name, name) for name in _WHISPER_MODELS])
         current_model = self.config.get("whisper_model", "turbo")
         model_index = self.transcribe_model_combo.findText(current_model)
         if model_index >= 0:
@@ -3951,7 +4900,7 @@ class VideoProcessingApp(QMainWindow):
         # Save model when changed
         self.transcribe_model_combo.currentTextChanged.connect(self.save_whisper_model)
         model_info = QLabel("(Turbo recommended for best accuracy/speed, ~1.5 GB)")
-        model_info.setStyleSheet("color: #666; font-size: 10px;")
+        model_info.setProperty("role", "hint")
         model_row.addWidget(model_label, 0)
         model_row.addWidget(self.transcribe_model_combo, 1)
         model_row.addWidget(model_info, 1)
@@ -3965,30 +4914,8 @@ class VideoProcessingApp(QMainWindow):
         buttons_layout = QHBoxLayout()
         
         self.transcribe_main_btn = QPushButton("Transcribe")
-        # Apply same styling as other buttons in the app
-        hover_color = "#b1588a"
-        self.transcribe_main_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #d168a3;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 4px 12px;
-                font-weight: bold;
-                min-height: 18px;
-                outline: none;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color};
-                border: none;
-                outline: none;
-            }}
-            QPushButton:pressed {{
-                background-color: {hover_color};
-                border: none;
-                outline: none;
-            }}
-        """)
+        # Same styling as other buttons in the app (see _TRANSCRIBE_TAB_QSS)
+        self.transcribe_main_btn.setObjectName("transcribeMain")
         self.transcribe_main_btn.clicked.connect(self.transcribe_from_tab)
         
         time_range_btn = QPushButton("Transcribe Time Range")
@@ -4004,21 +4931,15 @@ class VideoProcessingApp(QMainWindow):
         
         # Processing logs
         logs_label = QLabel("Processing Logs:")
-        logs_label.setFont(QFont("Arial", 10, QFont.Bold))
+        logs_label.setFont(self._BOLD10_FONT)
         layout.addWidget(logs_label)
         
-        self.transcribe_log_output = QTextEdit()
+        # Plain text log capped at _LOG_MAX_BLOCKS lines; Qt drops the oldest lines itself
+        self.transcribe_log_output = QPlainTextEdit()
         self.transcribe_log_output.setReadOnly(True)
+        self.transcribe_log_output.setMaximumBlockCount(_LOG_MAX_BLOCKS)
         self.transcribe_log_output.setMinimumHeight(200)
-        self.transcribe_log_output.setStyleSheet("""
-            QTextEdit {
-                background-color: #f5f5f5;
-                border: 1px solid #ddd;
-                border-radius: 3px;
-                font-family: 'Courier New', 'Menlo',monospace;
-                font-size: 11px;
-            }
-        """)
+        self.transcribe_log_output.setObjectName("transcribeLog")
         layout.addWidget(self.transcribe_log_output)
         
         # Progress bar for transcription
@@ -4026,50 +4947,27 @@ class VideoProcessingApp(QMainWindow):
         self.transcribe_progress_bar = QProgressBar()
         self.transcribe_progress_bar.setMinimumHeight(25)
         self.transcribe_progress_bar.setVisible(False)
-        self.transcribe_progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                text-align: center;
-                background-color: #f0f0f0;
-            }
-            QProgressBar::chunk {
-                background-color: #5dade2;
-                border-radius: 4px;
-            }
-        """)
+        self.transcribe_progress_bar.setObjectName("transcribeBar")
         
         self.transcribe_stop_btn = QPushButton("Stop")
         self.transcribe_stop_btn.setFixedWidth(80)
         self.transcribe_stop_btn.setVisible(False)
         self.transcribe_stop_btn.clicked.connect(self.stop_operation)
-        self.transcribe_stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #cc0000;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 4px 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #990000;
-            }
-        """)
+        self.transcribe_stop_btn.setProperty("role", "stop")
         
         progress_layout.addWidget(self.transcribe_progress_bar)
         progress_layout.addWidget(self.transcribe_stop_btn)
         layout.addLayout(progress_layout)
         
         tab.setLayout(layout)
+        # One stylesheet parse and polish for the finished tab
+        tab.setStyleSheet(_TRANSCRIBE_TAB_QSS)
         return tab
     
     def save_whisper_model(self, model: str):
         """Save Whisper model selection to config."""
-        config = load_config()
-        config["whisper_model"] = model
-        save_config(config)
         self.config["whisper_model"] = model
+        save_config(self.config)
     
     def browse_transcribe_file(self):
         """Browse for file to transcribe."""
@@ -4099,16 +4997,10 @@ class VideoProcessingApp(QMainWindow):
         # Get model from combo (saved to config automatically)
         model = self.transcribe_model_combo.currentText()
         
-        # Get whisper options from config
-        config = load_config()
+        # Get whisper options from the in-memory config (kept current by the settings dialogs)
+        config = self.config
         whisper_options = config.get("whisper_options", {})
         
-        # Process extra_args: convert multiline to space-separated if needed
-        if "extra_args" in whisper_options and "extra_args_parsed" not in whisper_options:
-            extra_args_text = whisper_options.get("extra_args", "")
-            extra_args = " ".join(line.strip() for line in extra_args_text.split("\n") if line.strip())
-            whisper_options["extra_args_parsed"] = extra_args
-        
         # Check if this is first time using transcription
         whisper_model_asked = config.get("whisper_model_asked", False)
         
@@ -4147,22 +5039,22 @@ class VideoProcessingApp(QMainWindow):
         def transcribe_with_params(video_path, language_code, model, whisper_options, output_format, progress_callback=None, log_callback=None):
             return transcribe_video(video_path, language_code, model, whisper_options, output_format, progress_callback, log_callback)
         
-        # Use custom callbacks for the tab
-        def tab_log_callback(msg):
-            self.transcribe_log(msg)
-        
         self.worker = ScriptWorker(transcribe_with_params, video_path, language_code, model, whisper_options, output_format)
-        self.worker.log_message.connect(tab_log_callback)
+        self.worker.log_message.connect(self.transcribe_log_lines)
         self.worker.finished.connect(self.on_transcribe_finished)
         self.worker.start()
     
     def transcribe_log(self, message):
         """Add message to transcription log."""
+        self.transcribe_log_lines([message])
+    
+    def transcribe_log_lines(self, lines: List[str]):
+        """Add a batch of messages to the transcription log with one timestamp."""
         from datetime import datetime
         timestamp = datetime.now().strftime("[%H:%M:%S]")
-        self.transcribe_log_output.append(f"{timestamp} {message}")
+        self.transcribe_log_output.appendPlainText("\n".join(f"{timestamp} {message}" for message in lines))
         # Also log to main log
-        self.log(message)
+        self.log_lines(lines)
     
     def on_transcribe_finished(self, success: bool):
         """Handle transcription completion."""
@@ -4182,7 +5074,7 @@ class VideoProcessingApp(QMainWindow):
         
         # Header
         header_label = QLabel("Remuxing Hub")
-        header_label.setFont(QFont("Arial", 14, QFont.Bold))
+        header_label.setFont(self._HEADER_FONT)
         layout.addWidget(header_label)
         
         desc_label = QLabel(
@@ -4190,7 +5082,7 @@ class VideoProcessingApp(QMainWindow):
             "and convert audio formats. Use track analysis to see available tracks before remuxing."
         )
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("color: #666;")
+        self._set_text_color(desc_label, "#666")
         layout.addWidget(desc_label)
         
         # File management
@@ -4199,7 +5091,10 @@ class VideoProcessingApp(QMainWindow):
         
         # Initialize selected files list and file configs
         self.remux_selected_files = []
-        self.remux_file_configs = {}  # Store per-file configuration
+        self.remux_file_configs: Dict[str, Dict] = {}  # Per-file configuration, keyed by str(path)
+        # Tree lookups without scanning: str(path) -> file item, (str(path), row key) -> fixed child row
+        self._remux_item_by_path: Dict[str, QTreeWidgetItem] = {}
+        self._remux_row_items: Dict[Tuple[str, str], QTreeWidgetItem] = {}
         
         # Buttons row
         buttons_row = QHBoxLayout()
@@ -4223,23 +5118,19 @@ class VideoProcessingApp(QMainWindow):
         self.remux_files_tree.setSelectionMode(QTreeWidget.ExtendedSelection)
         self.remux_files_tree.setRootIsDecorated(True)
         self.remux_files_tree.setAlternatingRowColors(True)
+        self.remux_files_tree.setUniformRowHeights(True)  # All rows are one line high; lets Qt lay out rows in constant time
         self.remux_files_tree.header().setStretchLastSection(False)
         self.remux_files_tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.remux_files_tree.setStyleSheet("""
-            QTreeWidget {
-                background-color: #f5f5f5;
-                border: 1px solid #ddd;
-                border-radius: 3px;
-                font-size: 11px;
-            }
-            QTreeWidget::item {
-                padding: 3px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #d168a3;
-                color: white;
-            }
-        """)
+        self.remux_files_tree.setObjectName("remuxFilesTree")
+        # Per-file Browse/Remux buttons and format combos are painted, not embedded widgets
+        remux_delegate = RemuxTreeDelegate(self.remux_files_tree)
+        remux_delegate.button_clicked.connect(self.on_remux_tree_button)
+        # Only Codec (format combo) and Actions (buttons) hold painted controls; other columns keep the default delegate
+        for column in (2, 5):
+            self.remux_files_tree.setItemDelegateForColumn(column, remux_delegate)
+        self.remux_files_tree.setEditTriggers(QTreeWidget.NoEditTriggers)
+        self.remux_files_tree.itemChanged.connect(self.on_remux_tree_item_changed)
+        self.remux_files_tree.itemExpanded.connect(self.on_remux_item_expanded)
         # Enable context menu
         self.remux_files_tree.setContextMenuPolicy(3)  # Qt.CustomContextMenu
         self.remux_files_tree.customContextMenuRequested.connect(self.show_track_context_menu)
@@ -4247,7 +5138,7 @@ class VideoProcessingApp(QMainWindow):
         
         # File count label
         self.remux_file_count_label = QLabel("No files selected")
-        self.remux_file_count_label.setStyleSheet("color: #666; font-size: 10px;")
+        self.remux_file_count_label.setProperty("role", "hint")
         file_layout.addWidget(self.remux_file_count_label)
         
         file_group.setLayout(file_layout)
@@ -4287,29 +5178,23 @@ class VideoProcessingApp(QMainWindow):
         
         # Minimal log (single line)
         log_label = QLabel("Status:")
-        log_label.setFont(QFont("Arial", 10, QFont.Bold))
+        log_label.setFont(self._BOLD10_FONT)
         layout.addWidget(log_label)
         
         self.remux_log_output = QLineEdit()
         self.remux_log_output.setReadOnly(True)
         self.remux_log_output.setPlaceholderText("Remuxing operations will show status here (errors only)")
-        self.remux_log_output.setStyleSheet("""
-            QLineEdit {
-                background-color: #f5f5f5;
-                border: 1px solid #ddd;
-                border-radius: 3px;
-                padding: 5px;
-                font-size: 11px;
-            }
-        """)
+        self.remux_log_output.setObjectName("remuxStatus")
         layout.addWidget(self.remux_log_output)
         
         layout.addStretch()
         tab.setLayout(layout)
+        # One stylesheet parse and polish for the finished tab
+        tab.setStyleSheet(_REMUX_TAB_QSS)
         return tab
     
     def add_remux_files(self):
-        """Add video files to the remux selection and analyze tracks."""
+        """Add video files to the remux selection; tracks are analyzed when a file is expanded."""
         file_paths, _ = QFileDialog.getOpenFileNames(
             self, "Select Video Files (MKV/MP4)",
             str(get_downloads_dir()),
@@ -4319,43 +5204,140 @@ class VideoProcessingApp(QMainWindow):
         if not file_paths:
             return
         
-        # Add new files (avoid duplicates)
-        for file_path in file_paths:
-            video_path = Path(file_path)
-            if video_path not in self.remux_selected_files:
-                self.remux_selected_files.append(video_path)
-                # Initialize file config
-                self.remux_file_configs[video_path] = {
-                    'output_format': self.remux_default_output_format.currentData(),
-                    'subtitle_file': None,  # Will be auto-detected or manually set
-                    'selected_video_tracks': [],
-                    'selected_audio_tracks': [],
-                    'selected_subtitle_tracks': []
-                }
-                # Add to tree widget
-                self.add_file_to_tree(video_path)
+        # Batch all row insertions into a single relayout/repaint
+        tree = self.remux_files_tree
+        sorting_enabled = tree.isSortingEnabled()
+        tree.setUpdatesEnabled(False)
+        tree.setSortingEnabled(False)
+        try:
+            # Add new files (avoid duplicates)
+            for file_path in file_paths:
+                video_path = Path(file_path)
+                if video_path not in self.remux_selected_files:
+                    self.remux_selected_files.append(video_path)
+                    # Initialize file config
+                    self.remux_file_configs[str(video_path)] = {
+                        'output_format': self.remux_default_output_format.currentData(),
+                        'subtitle_file': None,  # Will be auto-detected or manually set
+                        'selected_video_tracks': set(),
+                        'selected_audio_tracks': set(),
+                        'selected_subtitle_tracks': set(),
+                        'track_count': 0
+                    }
+                    # Add to tree widget
+                    self.add_file_to_tree(video_path)
+        finally:
+            tree.setSortingEnabled(sorting_enabled)
+            tree.setUpdatesEnabled(True)
         
         self.update_remux_file_count()
     
-    def add_file_to_tree(self, video_path: Path):
-        """Add a file to the tree widget with its tracks."""
+    def add_file_to_tree(self, video_path: Path) -> Optional[QTreeWidgetItem]:
+        """Add a file to the tree widget; its rows are created on first expand.
+        
+        Returns the (collapsed) file item, or None if the file does not exist.
+        """
         if not video_path.exists():
-            return
+            return None
         
         # Create file item
         file_item = QTreeWidgetItem(self.remux_files_tree)
         file_item.setText(0, video_path.name)
         file_item.setText(1, "File")
-        file_item.setExpanded(True)
-        file_item.setData(0, 256, str(video_path))  # Store path in data
+        path_str = str(video_path)
+        file_item.setData(0, 256, path_str)  # Store path in data
+        self._remux_item_by_path[path_str] = file_item
+        # Show the expand arrow before there are children; on_remux_item_expanded fills them in
+        file_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        # Probe right away so the tracks are cached by the time the file is expanded
+        self._start_track_probe(video_path)
+        
+        return file_item
+    
+    def _start_track_probe(self, video_path: Path):
+        """Probe a file's tracks in the global thread pool unless a probe for it is already running."""
+        path_str = str(video_path)
+        if path_str in self._track_probe_paths:
+            return
+        self._track_probe_paths.add(path_str)
+        job = TrackProbeRunnable(video_path)
+        job.signals.finished.connect(self.on_tracks_probed)
+        self._track_probe_signals.add(job.signals)  # Keep alive until the result arrives
+        QThreadPool.globalInstance().start(job)
+    
+    def on_remux_item_expanded(self, item: QTreeWidgetItem):
+        """Create a file's rows and start its track probe the first time it is expanded."""
+        if item.parent() is None and item.childCount() == 0:
+            self._populate_file_item(item, Path(item.data(0, 256)))
+    
+    def _populate_file_item(self, file_item: QTreeWidgetItem, video_path: Path):
+        """Add the track placeholder, external subtitle, output format and action rows to a file item."""
+        path_str = str(video_path)
+        
+        # Placeholder row until analyze_tracks finishes in the thread pool
+        pending_item = QTreeWidgetItem(file_item)
+        pending_item.setText(0, "Analyzing tracks...")
+        pending_item.setData(0, 256, "tracks_pending")
+        self._remux_row_items[(path_str, "tracks_pending")] = pending_item
+        # A cache hit if the probe started on add has already finished
+        self._start_track_probe(video_path)
+        
+        # Add external subtitle file option
+        subtitle_item = QTreeWidgetItem(file_item)
+        subtitle_item.setText(0, "External Subtitle File")
+        subtitle_item.setText(1, "External")
+        subtitle_item.setText(2, "SRT/VTT")
+        subtitle_item.setText(3, "")
+        subtitle_item.setText(4, "")
+        # Browse button in Actions column (painted by RemuxTreeDelegate)
+        subtitle_item.setText(5, "Browse...")
+        subtitle_item.setData(5, REMUX_CELL_ROLE, "button")
+        subtitle_item.setData(0, 256, "external_subtitle")
+        self._remux_row_items[(path_str, "external_subtitle")] = subtitle_item
+        
+        # Add per-file output format
+        format_item = QTreeWidgetItem(file_item)
+        format_item.setText(0, "Output Format")
+        format_item.setText(1, "Option")
+        # Format combo in Codec column (painted by RemuxTreeDelegate, edited on click)
+        default_format = self.remux_file_configs[path_str]['output_format']
+        format_label = next((label for label, ext in REMUX_OUTPUT_FORMATS if ext == default_format), default_format.upper())
+        format_item.setText(2, format_label)
+        format_item.setData(2, Qt.UserRole, default_format)
+        format_item.setData(2, REMUX_CELL_ROLE, "format")
+        format_item.setFlags(format_item.flags() | Qt.ItemIsEditable)
+        format_item.setData(0, 256, "output_format")
+        
+        # Add remux button for this file
+        remux_file_item = QTreeWidgetItem(file_item)
+        remux_file_item.setText(0, "Actions")
+        remux_file_item.setText(5, "Remux This File")
+        remux_file_item.setData(5, REMUX_CELL_ROLE, "button")
+        remux_file_item.setData(0, 256, "remux_action")
+    
+    def on_tracks_probed(self, video_path_str: str, tracks: Dict):
+        """Fill in a file's track rows once its background probe has finished."""
+        self._track_probe_signals.discard(self.sender())
+        self._track_probe_paths.discard(video_path_str)
         
-        # Analyze tracks
-        tracks = analyze_tracks(video_path)
+        # The file may have been removed while it was being probed
+        file_item = self._remux_item_by_path.get(video_path_str)
+        if file_item is None:
+            return
+        
+        # Nothing to fill until the file has been expanded; the result is in the track cache by then
+        pending_item = self._remux_row_items.pop((video_path_str, "tracks_pending"), None)
+        if pending_item is None:
+            return
+        file_item.removeChild(pending_item)
+        
+        track_items = []
         
         # Add video tracks
         if tracks['video']:
             for vid_track in tracks['video']:
-                track_item = QTreeWidgetItem(file_item)
+                track_item = QTreeWidgetItem()
+                track_items.append(track_item)
                 track_id = vid_track.get('track_id', 0)
                 codec = vid_track.get('codec', 'unknown')
                 res = vid_track.get('resolution', 'unknown')
@@ -4371,7 +5353,8 @@ class VideoProcessingApp(QMainWindow):
         # Add audio tracks
         if tracks['audio']:
             for aud_track in tracks['audio']:
-                track_item = QTreeWidgetItem(file_item)
+                track_item = QTreeWidgetItem()
+                track_items.append(track_item)
                 track_id = aud_track.get('track_id', 0)
                 codec = aud_track.get('codec', 'unknown')
                 channels = aud_track.get('channels', 0)
@@ -4388,7 +5371,8 @@ class VideoProcessingApp(QMainWindow):
         # Add embedded subtitle tracks
         if tracks['subtitles']:
             for sub_track in tracks['subtitles']:
-                track_item = QTreeWidgetItem(file_item)
+                track_item = QTreeWidgetItem()
+                track_items.append(track_item)
                 track_id = sub_track.get('track_id', 0)
                 format_type = sub_track.get('format', sub_track.get('codec', 'unknown'))
                 track_item.setText(0, f"Subtitle Track {track_id}")
@@ -4400,44 +5384,38 @@ class VideoProcessingApp(QMainWindow):
                 track_item.setCheckState(0, 0)  # Unchecked by default (external subs preferred)
                 track_item.setData(0, 256, f"subtitle:{track_id}")  # Store track info
         
-        # Add external subtitle file option
-        subtitle_item = QTreeWidgetItem(file_item)
-        subtitle_item.setText(0, "External Subtitle File")
-        subtitle_item.setText(1, "External")
-        subtitle_item.setText(2, "SRT/VTT")
-        subtitle_item.setText(3, "")
-        subtitle_item.setText(4, "")
-        # Add browse button in Actions column
-        browse_sub_btn = QPushButton("Browse...")
-        browse_sub_btn.setMaximumWidth(80)
-        browse_sub_btn.clicked.connect(lambda checked, path=video_path: self.browse_subtitle_file(path))
-        self.remux_files_tree.setItemWidget(subtitle_item, 5, browse_sub_btn)
-        subtitle_item.setData(0, 256, "external_subtitle")
-        
-        # Add per-file output format
-        format_item = QTreeWidgetItem(file_item)
-        format_item.setText(0, "Output Format")
-        format_item.setText(1, "Option")
-        format_combo = QComboBox()
-        format_combo.addItem("MKV", "mkv")
-        format_combo.addItem("MP4", "mp4")
-        # Set current format
-        default_format = self.remux_file_configs[video_path]['output_format']
-        format_index = format_combo.findData(default_format)
-        if format_index >= 0:
-            format_combo.setCurrentIndex(format_index)
-        format_combo.currentIndexChanged.connect(lambda idx, path=video_path: self.update_file_output_format(path, format_combo.currentData()))
-        self.remux_files_tree.setItemWidget(format_item, 2, format_combo)
-        format_item.setData(0, 256, "output_format")
-        
-        # Add remux button for this file
-        remux_file_item = QTreeWidgetItem(file_item)
-        remux_file_item.setText(0, "Actions")
-        remux_file_btn = QPushButton("Remux This File")
-        remux_file_btn.setMaximumWidth(120)
-        remux_file_btn.clicked.connect(lambda checked, path=video_path: self.remux_single_file(path))
-        self.remux_files_tree.setItemWidget(remux_file_item, 5, remux_file_btn)
-        remux_file_item.setData(0, 256, "remux_action")
+        file_item.insertChildren(0, track_items)
+        
+        # Mirror the initial check states; on_remux_tree_item_changed keeps them current
+        file_config = self.remux_file_configs.get(video_path_str)
+        if file_config is not None:
+            file_config['track_count'] = len(track_items)
+            for key in _SELECTED_TRACK_KEYS.values():
+                file_config[key] = set()
+            for track_item in track_items:
+                self._sync_track_selection(file_config, track_item)
+    
+    def _sync_track_selection(self, file_config: Dict, track_item: QTreeWidgetItem):
+        """Record a track row's check state in its file's selected_*_tracks set."""
+        track_type, _, track_id = (track_item.data(0, 256) or "").partition(':')
+        key = _SELECTED_TRACK_KEYS.get(track_type)
+        if key is None:
+            return  # Not a track row
+        if track_item.checkState(0) == 2:  # Checked
+            file_config[key].add(int(track_id))
+        else:
+            file_config[key].discard(int(track_id))
+    
+    def _files_for_selected_items(self, selected_items) -> Dict[str, Path]:
+        """Map the files behind the selected tree rows, str(path) -> Path, in selection order."""
+        files = {}
+        for item in selected_items:
+            # A track/option row stands for its parent file
+            parent = item.parent()
+            file_path_str = (parent if parent is not None else item).data(0, 256)
+            if file_path_str and file_path_str not in files:
+                files[file_path_str] = Path(file_path_str)
+        return files
     
     def remove_remux_files(self):
         """Remove selected files from the remux selection."""
@@ -4446,36 +5424,22 @@ class VideoProcessingApp(QMainWindow):
             QMessageBox.information(self, "No Selection", "Please select files to remove.")
             return
         
-        # Get top-level items (files) from selection
-        files_to_remove = []
-        for item in selected_items:
-            # If it's a top-level item (file), use it directly
-            parent = item.parent()
-            if parent is None:
-                # It's a file item
-                file_path_str = item.data(0, 256)
-                if file_path_str:
-                    files_to_remove.append(Path(file_path_str))
-            else:
-                # It's a track item, get the parent file
-                file_path_str = parent.data(0, 256)
-                if file_path_str and Path(file_path_str) not in files_to_remove:
-                    files_to_remove.append(Path(file_path_str))
+        files_to_remove = self._files_for_selected_items(selected_items)
+        removed_paths = set(files_to_remove.values())
+        self.remux_selected_files[:] = [p for p in self.remux_selected_files if p not in removed_paths]
         
         # Remove files
-        for file_path in files_to_remove:
-            if file_path in self.remux_selected_files:
-                self.remux_selected_files.remove(file_path)
-            if file_path in self.remux_file_configs:
-                del self.remux_file_configs[file_path]
+        for path_str in files_to_remove:
+            self.remux_file_configs.pop(path_str, None)
             
             # Remove from tree
-            root = self.remux_files_tree.invisibleRootItem()
-            for i in range(root.childCount()):
-                child = root.child(i)
-                if child.data(0, 256) == str(file_path):
-                    root.removeChild(child)
-                    break
+            file_item = self._remux_item_by_path.pop(path_str, None)
+            if file_item is not None:
+                self.remux_files_tree.invisibleRootItem().removeChild(file_item)
+            self._remux_row_items.pop((path_str, "tracks_pending"), None)
+            self._remux_row_items.pop((path_str, "external_subtitle"), None)
+        clear_analyze_cache(files_to_remove)
+        clear_dir_listing_cache()
         
         self.update_remux_file_count()
     
@@ -4483,7 +5447,11 @@ class VideoProcessingApp(QMainWindow):
         """Clear all selected files."""
         self.remux_selected_files.clear()
         self.remux_file_configs.clear()
+        self._remux_item_by_path.clear()
+        self._remux_row_items.clear()
         self.remux_files_tree.clear()
+        clear_analyze_cache()
+        clear_dir_listing_cache()
         self.update_remux_file_count()
     
     def browse_subtitle_file(self, video_path: Path):
@@ -4495,165 +5463,191 @@ class VideoProcessingApp(QMainWindow):
         )
         
         if subtitle_file:
-            self.remux_file_configs[video_path]['subtitle_file'] = Path(subtitle_file)
+            self.remux_file_configs[str(video_path)]['subtitle_file'] = Path(subtitle_file)
             # Update the tree item text to show selected file
-            root = self.remux_files_tree.invisibleRootItem()
-            for i in range(root.childCount()):
-                file_item = root.child(i)
-                if file_item.data(0, 256) == str(video_path):
-                    # Find the external subtitle item
-                    for j in range(file_item.childCount()):
-                        child = file_item.child(j)
-                        if child.data(0, 256) == "external_subtitle":
-                            child.setText(2, Path(subtitle_file).name)
-                            break
-                    break
+            subtitle_item = self._remux_row_items.get((str(video_path), "external_subtitle"))
+            if subtitle_item is not None:
+                subtitle_item.setText(2, Path(subtitle_file).name)
+    
+    def on_remux_tree_button(self, index):
+        """Handle a click on a painted Browse.../Remux This File button."""
+        item = self.remux_files_tree.itemFromIndex(index)
+        if item is None or item.parent() is None:
+            return
+        video_path = Path(item.parent().data(0, 256))
+        action = item.data(0, 256)
+        if action == "external_subtitle":
+            self.browse_subtitle_file(video_path)
+        elif action == "remux_action":
+            self.remux_single_file(video_path)
+    
+    def on_remux_tree_item_changed(self, item: QTreeWidgetItem, column: int):
+        """Store track check states and per-file output formats edited in the remux tree."""
+        parent = item.parent()
+        if parent is None:
+            return
+        if column == 0:
+            file_config = self.remux_file_configs.get(parent.data(0, 256))
+            if file_config is not None:
+                self._sync_track_selection(file_config, item)
+            return
+        if column != 2 or item.data(0, 256) != "output_format":
+            return
+        output_format = item.data(2, Qt.UserRole)
+        if output_format:
+            self.update_file_output_format(Path(parent.data(0, 256)), output_format)
     
     def update_file_output_format(self, video_path: Path, output_format: str):
         """Update output format for a specific file."""
-        if video_path in self.remux_file_configs:
-            self.remux_file_configs[video_path]['output_format'] = output_format
+        file_config = self.remux_file_configs.get(str(video_path))
+        if file_config is not None:
+            file_config['output_format'] = output_format
     
-    def remux_single_file(self, video_path: Path):
-        """Remux a single file with its configured tracks and options."""
-        if video_path not in self.remux_file_configs:
-            self.remux_log_output.setText(f"Error: Configuration not found for {video_path.name}")
-            return
+    def _collect_remux_job(self, video_path: Path) -> Optional[tuple]:
+        """Read a file's configured output format and checked tracks from its config.
         
-        config = self.remux_file_configs[video_path]
+        Returns the remux_file_with_tracks arguments, or None after showing why the file can't be remuxed.
+        """
+        config = self.remux_file_configs.get(str(video_path))
+        if config is None:
+            self.remux_log_output.setText(f"Error: Configuration not found for {video_path.name}")
+            return None
+
         output_format = config['output_format']
         
-        # Get selected tracks from tree
-        root = self.remux_files_tree.invisibleRootItem()
-        file_item = None
-        for i in range(root.childCount()):
-            child = root.child(i)
-            if child.data(0, 256) == str(video_path):
-                file_item = child
-                break
-        
-        if not file_item:
+        path_str = str(video_path)
+        if path_str not in self._remux_item_by_path:
             self.remux_log_output.setText(f"Error: File not found in tree")
-            return
+            return None
+        
+        if (path_str, "tracks_pending") in self._remux_row_items:
+            self.remux_log_output.setText(f"Still analyzing tracks for {video_path.name}, try again in a moment")
+            return None
         
-        # Collect selected tracks
-        selected_video = []
-        selected_audio = []
-        selected_subtitles = []
+        # Checked tracks are kept in the config by on_remux_tree_item_changed, no tree walk needed
+        selected = {track_type: sorted(config.get(key, ())) for track_type, key in _SELECTED_TRACK_KEYS.items()}
         external_subtitle = config.get('subtitle_file')
         
-        for i in range(file_item.childCount()):
-            track_item = file_item.child(i)
-            if track_item.checkState(0) == 2:  # Checked
-                track_data = track_item.data(0, 256)
-                if track_data:
-                    track_type, track_id = track_data.split(':')
-                    track_id = int(track_id)
-                    if track_type == 'video':
-                        selected_video.append(track_id)
-                    elif track_type == 'audio':
-                        selected_audio.append(track_id)
-                    elif track_type == 'subtitle':
-                        selected_subtitles.append(track_id)
-        
-        # Remux the file
-        self.remux_log_output.setText(f"Remuxing {video_path.name}...")
-        success = self.remux_file_with_tracks(
-            video_path, output_format, selected_video, selected_audio, 
-            selected_subtitles, external_subtitle
-        )
+        # Every track checked and no external subtitle: map streams by type instead of one -map per track
+        track_count = config.get('track_count', 0)
+        all_tracks = bool(track_count) and not external_subtitle and sum(map(len, selected.values())) == track_count
         
-        if success:
-            self.remux_log_output.setText(f"✓ Remuxed {video_path.name}")
-        else:
-            self.remux_log_output.setText(f"✗ Failed to remux {video_path.name}")
+        return (video_path, output_format, selected['video'], selected['audio'],
+                selected['subtitle'], external_subtitle, all_tracks)
     
-    def remux_file_with_tracks(self, video_path: Path, output_format: str,
-                               video_tracks: List[int], audio_tracks: List[int],
-                               subtitle_tracks: List[int], external_subtitle: Path = None) -> bool:
-        """Remux a file with specific track selections.
+    def remux_single_file(self, video_path: Path):
+        """Remux a single file with its configured tracks and options.
         
-        Note: Track IDs from analyze_tracks correspond to FFmpeg stream indices.
+        FFmpeg runs in a QProcess so the UI stays responsive; its progress
+        output drives the percentage shown in the status line.
         """
-        if not video_path.exists():
-            return False
+        path_str = str(video_path)
+        # Checked before the output exists() shortcut: a running remux has a partial output
+        if path_str in self._remux_in_flight:
+            self.remux_log_output.setText(f"{video_path.name} is already being remuxed")
+            return
+        if len(self._remux_processes) >= (os.cpu_count() or 1):
+            self.remux_log_output.setText("Too many remuxes running, try again when one finishes")
+            return
         
-        base = video_path.stem
-        output_file = video_path.parent / f"{base}_remuxed.{output_format}"
+        job = self._collect_remux_job(video_path)
+        if job is None:
+            return
+        _, output_format, video_tracks, audio_tracks, subtitle_tracks, external_subtitle, all_tracks = job
         
+        if not video_path.exists():
+            self.remux_log_output.setText(f"✗ Failed to remux {video_path.name}")
+            return
+        output_file = get_remux_output_path(video_path, output_format)
         if output_file.exists():
-            return True  # Already exists
-        
-        # Build FFmpeg command with track selection
-        cmd = ["ffmpeg", "-y", "-i", str(video_path)]
-        
-        # Map selected tracks (track_id from analyze_tracks is the stream index)
-        for vid_track in video_tracks:
-            cmd.extend(["-map", f"0:{vid_track}"])
-        
-        for aud_track in audio_tracks:
-            cmd.extend(["-map", f"0:{aud_track}"])
-        
-        for sub_track in subtitle_tracks:
-            cmd.extend(["-map", f"0:{sub_track}"])
+            self.remux_log_output.setText(f"✓ Remuxed {video_path.name}")  # Already exists
+            return
         
-        # Add external subtitle if provided
-        if external_subtitle and external_subtitle.exists():
-            cmd.extend(["-i", str(external_subtitle)])
-            cmd.extend(["-map", "1:0"])  # Map first stream from second input
-            subtitle_format = "srt" if external_subtitle.suffix.lower() == ".srt" else "vtt"
-            cmd.extend(["-c:s", subtitle_format])
+        clear_dir_listing_cache()  # Pick up subtitle files created since the last remux
+        cmd = build_remux_command(video_path, output_file, video_tracks, audio_tracks,
+                                  subtitle_tracks, external_subtitle, all_tracks)
+        # Machine-readable progress on stderr instead of the interactive stats line
+        cmd[1:1] = ["-progress", "pipe:2", "-nostats"]
+        
+        process = QProcess(self)
+        self._remux_in_flight.add(path_str)
+        self._remux_processes[path_str] = {
+            'process': process,
+            'output_file': output_file,
+            'duration_us': 0,
+            'pending': b"",  # Incomplete trailing stderr line
+            'stderr_tail': b"",  # Last raw stderr bytes, reported on failure
+        }
+        process.readyReadStandardError.connect(lambda: self.on_remux_process_output(path_str))
+        process.finished.connect(lambda exit_code, _status: self.on_remux_process_finished(path_str, exit_code))
+        process.errorOccurred.connect(lambda error: self.on_remux_process_error(path_str, error))
         
-        # If no tracks explicitly selected, include all tracks (default)
-        if not video_tracks and not audio_tracks and not subtitle_tracks:
-            # Rebuild command to include all tracks
-            cmd = ["ffmpeg", "-y", "-i", str(video_path)]
-            
-            # Add external subtitle if provided
-            if external_subtitle and external_subtitle.exists():
-                cmd.extend(["-i", str(external_subtitle)])
-                cmd.extend(["-map", "0"])  # Map all tracks from video
-                cmd.extend(["-map", "1:0"])  # Map subtitle from external file
-                subtitle_format = "srt" if external_subtitle.suffix.lower() == ".srt" else "vtt"
-                cmd.extend(["-c", "copy", "-c:s", subtitle_format])
-            else:
-                # Check for auto-detected subtitle file
-                folder_path = video_path.parent
-                base = video_path.stem
-                srt_file = folder_path / f"{base}.srt"
-                vtt_file = folder_path / f"{base}.vtt"
-                
-                if srt_file.exists():
-                    cmd.extend(["-i", str(srt_file)])
-                    cmd.extend(["-map", "0"])  # All video tracks
-                    cmd.extend(["-map", "1:0"])  # Subtitle
-                    cmd.extend(["-c", "copy", "-c:s", "srt"])
-                elif vtt_file.exists():
-                    cmd.extend(["-i", str(vtt_file)])
-                    cmd.extend(["-map", "0"])  # All video tracks
-                    cmd.extend(["-map", "1:0"])  # Subtitle
-                    cmd.extend(["-c", "copy", "-c:s", "vtt"])
-                else:
-                    # Just copy all tracks
-                    cmd.extend(["-c", "copy"])
-            
-            cmd.append(str(output_file))
+        self.remux_log_output.setText(f"Remuxing {video_path.name}...")
+        process.start(cmd[0], cmd[1:])
+    
+    def on_remux_process_output(self, path_str: str):
+        """Parse FFmpeg progress from a running single-file remux."""
+        state = self._remux_processes.get(path_str)
+        if state is None:
+            return
+        # Scan the complete lines of the raw buffer; only the partial last line is carried over
+        data = state['pending'] + state['process'].readAllStandardError().data()
+        cut = data.rfind(b"\n") + 1
+        state['pending'] = data[cut:]
+        if not cut:
+            return
+        complete = memoryview(data)[:cut]
+        state['stderr_tail'] = (state['stderr_tail'] + complete)[-_FFMPEG_STDERR_TAIL_BYTES:]
+        
+        if not state['duration_us']:
+            match = _FFMPEG_DURATION_RE.search(complete)
+            if match:
+                hours, minutes, seconds = match.groups()
+                state['duration_us'] = int((int(hours) * 3600 + int(minutes) * 60 + float(seconds)) * 1_000_000)
+        
+        # Only the newest position matters when several progress blocks arrive at once
+        out_times = _FFMPEG_OUT_TIME_RE.findall(complete)
+        if out_times and state['duration_us']:
+            percent = min(100, int(out_times[-1]) * 100 // state['duration_us'])
+            self.remux_log_output.setText(f"Remuxing {Path(path_str).name}... {percent}%")
+    
+    def on_remux_process_finished(self, path_str: str, exit_code: int):
+        """Report the outcome of a single-file remux."""
+        state = self._remux_processes.pop(path_str, None)
+        if state is None:
+            return
+        self._remux_in_flight.discard(path_str)
+        state['process'].deleteLater()
+        name = Path(path_str).name
+        if exit_code == 0 and state['output_file'].exists():
+            self.remux_log_output.setText(f"✓ Remuxed {name}")
         else:
-            # Copy codecs for selected tracks
-            cmd.extend(["-c", "copy"])
-            cmd.append(str(output_file))
-        
-        # Execute
+            self._remove_partial_remux(state['output_file'])
+            # Report the last few non-progress (no "key=value") lines
+            lines = state['stderr_tail'].decode(errors="replace").splitlines()
+            error_lines = [line.strip() for line in lines if line.strip() and "=" not in line][-5:]
+            self.remux_log_output.setText(f"✗ Failed to remux {name}: {'; '.join(error_lines) or 'Unknown error'}")
+    
+    def on_remux_process_error(self, path_str: str, error):
+        """Handle FFmpeg failing to start (finished is not emitted in that case)."""
+        if error != QProcess.FailedToStart:
+            return
+        state = self._remux_processes.pop(path_str, None)
+        if state is None:
+            return
+        self._remux_in_flight.discard(path_str)
+        state['process'].deleteLater()
+        self._remove_partial_remux(state['output_file'])
+        self.remux_log_output.setText(
+            f"✗ Failed to remux {Path(path_str).name}: {state['process'].errorString()}")
+    
+    def _remove_partial_remux(self, output_file: Path):
+        """Delete a failed remux's output so a truncated file is not taken as already remuxed."""
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            if result.returncode != 0:
-                # Log error to minimal log
-                error_msg = result.stderr.split('\n')[-5:] if result.stderr else ["Unknown error"]
-                self.remux_log_output.setText(f"Error: {'; '.join(error_msg)}")
-            return result.returncode == 0 and output_file.exists()
-        except Exception as e:
-            self.remux_log_output.setText(f"Error: {str(e)}")
-            return False
+            if output_file.exists():
+                output_file.unlink()
+        except OSError as e:
+            print(f"Could not remove partial remux output {output_file}: {e}")
     
     def remux_selected_files_action(self):
         """Remux all selected files in the tree."""
@@ -4662,34 +5656,86 @@ class VideoProcessingApp(QMainWindow):
             QMessageBox.information(self, "No Selection", "Please select files to remux.")
             return
         
-        # Get top-level file items
-        files_to_remux = []
-        for item in selected_items:
-            parent = item.parent()
-            if parent is None:
-                # It's a file item
-                file_path_str = item.data(0, 256)
-                if file_path_str:
-                    files_to_remux.append(Path(file_path_str))
-            else:
-                # It's a track item, get the parent file
-                file_path_str = parent.data(0, 256)
-                if file_path_str and Path(file_path_str) not in files_to_remux:
-                    files_to_remux.append(Path(file_path_str))
+        files_to_remux = list(self._files_for_selected_items(selected_items).values())
         
         if not files_to_remux:
             self.remux_log_output.setText("Error: No files selected")
             return
         
-        # Remux each file
-        success_count = 0
+        if self._remux_batch is not None:
+            self.remux_log_output.setText("A remux batch is already running")
+            return
+        
+        jobs = []
+        skipped = []  # Files _collect_remux_job turned down (no config, tracks still analyzing)
         for video_path in files_to_remux:
-            self.remux_single_file(video_path)
-            if self.remux_log_output.text().startswith("✓"):
-                success_count += 1
+            job = self._collect_remux_job(video_path)
+            if job is None:
+                skipped.append(f"{video_path.name}: skipped")
+            else:
+                jobs.append(job)
+        if not jobs:
+            return  # _collect_remux_job already showed why
+        
+        # Files already being remuxed on their own are left out; their partial
+        # output must not be mistaken for a finished one below
+        busy = [job for job in jobs if str(job[0]) in self._remux_in_flight]
+        if busy:
+            jobs = [job for job in jobs if str(job[0]) not in self._remux_in_flight]
+            if not jobs:
+                self.remux_log_output.setText(" | ".join(
+                    [f"{len(busy)} selected file(s) already being remuxed", *skipped]))
+                return
+        total = len(jobs)
+        
+        # Already remuxed files count as done without taking a pool slot
+        pending_jobs = [job for job in jobs if not get_remux_output_path(job[0], job[1]).exists()]
+        already_done = len(jobs) - len(pending_jobs)
+        if not pending_jobs:
+            self.remux_log_output.setText(" | ".join([f"✓ Remuxed {already_done}/{total} files", *skipped]))
+            return
+        
+        # Remux the files concurrently; results arrive in on_remux_finished
+        clear_dir_listing_cache()  # One fresh listing per folder for this batch
+        self._remux_batch = {
+            'total': total,
+            'done': total - len(pending_jobs),
+            'succeeded': already_done,
+            'errors': skipped,  # "name: error" per failed or skipped file, shown when the batch ends
+        }
+        self.remux_log_output.setText(" | ".join([f"Remuxing {len(pending_jobs)} file(s)...", *skipped]))
+        for job in pending_jobs:
+            self._remux_in_flight.add(str(job[0]))
+            runnable = RemuxRunnable(*job)
+            runnable.signals.finished.connect(self.on_remux_finished)
+            self._remux_signals.add(runnable.signals)  # Keep alive until the result arrives
+            self._remux_pool.start(runnable)
+    
+    def on_remux_finished(self, video_path_str: str, success: bool, error: str):
+        """Record one finished file of a remux batch and report when the batch is done."""
+        self._remux_signals.discard(self.sender())
+        self._remux_in_flight.discard(video_path_str)
+        batch = self._remux_batch
+        if batch is None:
+            return
+        batch['done'] += 1
+        if success:
+            batch['succeeded'] += 1
+        else:
+            batch['errors'].append(f"{Path(video_path_str).name}: {error or 'Unknown error'}")
+        
+        if batch['done'] < batch['total']:
+            self.remux_log_output.setText(f"Remuxing... {batch['done']}/{batch['total']} done")
+            return
         
-        if success_count > 0:
-            self.remux_log_output.setText(f"✓ Remuxed {success_count}/{len(files_to_remux)} files")
+        self._remux_batch = None
+        if batch['succeeded'] > 0:
+            status = f"✓ Remuxed {batch['succeeded']}/{batch['total']} files"
+        else:
+            status = f"✗ Failed to remux {batch['total']} file(s)"
+        if batch['errors']:
+            status += f" | {' | '.join(batch['errors'])}"
+        self.remux_log_output.setText(status)
     
     def show_track_context_menu(self, position):
         """Show context menu for track items."""
@@ -4735,15 +5781,12 @@ class VideoProcessingApp(QMainWindow):
     
     def show_track_info(self, file_path: Path, track_type: str, track_id: int):
         """Show detailed information for a specific track."""
-        tracks = analyze_tracks(file_path)
+        tracks = analyze_tracks_cached(file_path)
         
         track_info = None
-        if track_type == 'video':
-            track_info = next((t for t in tracks['video'] if t.get('track_id') == track_id), None)
-        elif track_type == 'audio':
-            track_info = next((t for t in tracks['audio'] if t.get('track_id') == track_id), None)
-        elif track_type == 'subtitle':
-            track_info = next((t for t in tracks['subtitles'] if t.get('track_id') == track_id), None)
+        tracks_key = _TRACK_TYPE_KEYS.get(track_type)
+        if tracks_key:
+            track_info = next((t for t in tracks[tracks_key] if t.get('track_id') == track_id), None)
         
         if not track_info:
             QMessageBox.warning(self, "Error", "Track information not found.")
@@ -4758,6 +5801,7 @@ class VideoProcessingApp(QMainWindow):
         
         info_text = QTextEdit()
         info_text.setReadOnly(True)
+        info_text.setUndoRedoEnabled(False)
         info_text.setFont(QFont("Courier New", 10))
         
         info_lines = [f"Track Type: {track_type.upper()}", f"Track ID: {track_id}", ""]
@@ -4813,13 +5857,11 @@ class VideoProcessingApp(QMainWindow):
         
         if dialog.exec_() == QDialog.Accepted:
             # Store language preference for this track (can be used during remux)
-            if file_path not in self.remux_file_configs:
-                self.remux_file_configs[file_path] = {'track_languages': {}}
-            elif 'track_languages' not in self.remux_file_configs[file_path]:
-                self.remux_file_configs[file_path]['track_languages'] = {}
+            file_config = self.remux_file_configs.setdefault(str(file_path), {})
+            track_languages = file_config.setdefault('track_languages', {})
             
             track_key = f"{track_type}:{track_id}"
-            self.remux_file_configs[file_path]['track_languages'][track_key] = lang_combo.currentText()
+            track_languages[track_key] = lang_combo.currentText()
             
             # Update tree display
             tree_item.setText(3, lang_combo.currentText())
@@ -4879,7 +5921,7 @@ class VideoProcessingApp(QMainWindow):
             self.remux_log_output.setText(f"Error: File not found: {first_file.name}")
             return
         
-        tracks = analyze_tracks(first_file)
+        tracks = analyze_tracks_cached(first_file)
         if not tracks['audio']:
             self.remux_log_output.setText("Error: No audio tracks found in video files.")
             return
@@ -4889,33 +5931,52 @@ class VideoProcessingApp(QMainWindow):
             self.remux_log_output.setText("Error: Could not determine audio channel count.")
             return
         
-        # Create minimal log callback
-        success_count = 0
-        errors = []
-        
-        def split_log_callback(msg):
-            nonlocal success_count
-            if "✓ Extracted channel" in msg:
-                success_count += 1
-            elif "Error:" in msg or "✗" in msg:
-                errors.append(msg)
-                if len(errors) == 1:
-                    self.remux_log_output.setText(msg)
-                else:
-                    self.remux_log_output.setText(f"{len(errors)} error(s) occurred")
+        if self._split_batch is not None:
+            self.remux_log_output.setText("Audio channels are already being split")
+            return
         
+        video_files = [video_file for video_file in self.remux_selected_files if video_file.exists()]
         self.remux_log_output.setText(f"Splitting audio channels ({channel_count} channels)...")
         
-        # Process files directly (output to same directory as each file)
-        for video_file in self.remux_selected_files:
-            if video_file.exists():
-                output_dir = video_file.parent
-                split_audio_channels(video_file, output_dir, channel_count, split_log_callback)
+        # Split the files concurrently (output to same directory as each file); results arrive in on_split_finished
+        self._split_batch = {
+            'total': len(video_files),
+            'done': 0,
+            'failed': 0,
+            'errors': [],
+            'channel_count': channel_count,
+            'file_count': len(self.remux_selected_files),
+        }
+        for video_file in video_files:
+            runnable = SplitChannelsRunnable(video_file, channel_count)
+            runnable.signals.finished.connect(self.on_split_finished)
+            self._remux_signals.add(runnable.signals)  # Keep alive until the result arrives
+            self._remux_pool.start(runnable)
+    
+    def on_split_finished(self, video_path_str: str, success: bool, errors: List[str]):
+        """Record one finished file of a channel split batch and report when the batch is done."""
+        self._remux_signals.discard(self.sender())
+        batch = self._split_batch
+        if batch is None:
+            return
+        batch['done'] += 1
+        if not success:
+            batch['failed'] += 1
+        batch['errors'].extend(errors)
+        if batch['errors']:
+            if len(batch['errors']) == 1:
+                self.remux_log_output.setText(batch['errors'][0])
+            else:
+                self.remux_log_output.setText(f"{len(batch['errors'])} error(s) occurred")
+        
+        if batch['done'] < batch['total']:
+            return
         
-        if errors:
-            self.remux_log_output.setText(f"Error: {len(errors)} file(s) failed")
+        self._split_batch = None
+        if batch['errors']:
+            self.remux_log_output.setText(f"Error: {batch['failed'] or len(batch['errors'])} file(s) failed")
         else:
-            self.remux_log_output.setText(f"✓ Split {channel_count} channels for {len(self.remux_selected_files)} file(s)")
+            self.remux_log_output.setText(f"✓ Split {batch['channel_count']} channels for {batch['file_count']} file(s)")
     
     def init_ui(self):
         """Initialize the UI."""
@@ -4950,7 +6011,7 @@ class VideoProcessingApp(QMainWindow):
         header_left_layout.addWidget(app_name_label)
         
         # Version number below title
-        version_label = QLabel('version 9.2.2 "Polyglot"')
+        version_label = QLabel(f'version {APP_VERSION} "Polyglot"')
         version_label.setFont(QFont("Arial", 18))
         version_label.setStyleSheet("color: #999; font-style: italic;")
         header_left_layout.addWidget(version_label)
@@ -4964,11 +6025,11 @@ class VideoProcessingApp(QMainWindow):
         header_layout.addStretch()
         
         # Top bar with About, FAQ, and Settings
-        about_btn = QPushButton("About")
+        about_btn = self._make_button("About", "top")
         about_btn.clicked.connect(self.open_about)
-        faq_btn = QPushButton("FAQ")
+        faq_btn = self._make_button("FAQ", "top")
         faq_btn.clicked.connect(self.open_faq)
-        settings_btn = QPushButton("Settings")
+        settings_btn = self._make_button("Settings", "top")
         settings_btn.clicked.connect(self.open_settings)
         header_layout.addWidget(about_btn)
         header_layout.addWidget(faq_btn)
@@ -4986,7 +6047,7 @@ class VideoProcessingApp(QMainWindow):
         
         # Download section
         download_group = QGroupBox("DOWNLOAD")
-        download_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        download_group.setProperty("role", "section")
         download_layout = QVBoxLayout()
         
         # Episodes row and Instructions link
@@ -4998,9 +6059,8 @@ class VideoProcessingApp(QMainWindow):
         self.starting_episode_input.setPlaceholderText("1 or 1-5 or 1,3,5-7")
         self.starting_episode_input.setToolTip("Episode numbers:\n• Single: 1\n• Range: 1-5\n• Mixed: 1,3,5-7,10")
         
-        instructions_btn = QPushButton("How to get commands")
+        instructions_btn = self._make_button("How to get commands", "download")
         instructions_btn.setFlat(True)
-        instructions_btn.setStyleSheet("color: #0066cc; text-decoration: underline;")
         instructions_btn.setCursor(Qt.PointingHandCursor)
         instructions_btn.clicked.connect(lambda: QDesktopServices.openUrl(QUrl(DOWNLOAD_INSTRUCTIONS_URL)))
         instructions_btn.setToolTip("Opens instructions in your browser")
@@ -5025,15 +6085,15 @@ class VideoProcessingApp(QMainWindow):
         download_layout.addWidget(self.commands_text)
         
         download_buttons = QHBoxLayout()
-        clear_btn = QPushButton("Clear")
+        clear_btn = self._make_button("Clear", "download")
         clear_btn.clicked.connect(lambda: self.commands_text.clear())
-        download_btn = QPushButton("Batch download episodes")
+        download_btn = self._make_button("Batch download episodes", "download")
         download_btn.clicked.connect(self.download_episodes)
-        add_videos_btn = QPushButton("Add videos...")
+        add_videos_btn = self._make_button("Add videos...", "download")
         add_videos_btn.clicked.connect(self.add_videos)
-        open_lossless_btn = QPushButton("Open in LosslessCut...")
+        open_lossless_btn = self._make_button("Open in LosslessCut...", "download")
         open_lossless_btn.clicked.connect(self.open_lossless_cut)
-        open_downloads_btn = QPushButton("Open Downloads folder")
+        open_downloads_btn = self._make_button("Open Downloads folder", "download")
         open_downloads_btn.clicked.connect(lambda: open_folder_in_explorer(get_downloads_dir()))
         download_buttons.addWidget(clear_btn)
         download_buttons.addWidget(download_btn)
@@ -5046,15 +6106,15 @@ class VideoProcessingApp(QMainWindow):
         
         # Subtitles section
         subtitles_group = QGroupBox("SUBTITLES")
-        subtitles_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        subtitles_group.setProperty("role", "section")
         subtitles_layout = QHBoxLayout()
-        extract_btn = QPushButton("Extract subtitles")
+        extract_btn = self._make_button("Extract subtitles", "subtitles")
         extract_btn.clicked.connect(self.extract_subtitles)
-        clean_btn = QPushButton("Clean subtitles")
+        clean_btn = self._make_button("Clean subtitles", "subtitles")
         clean_btn.clicked.connect(self.clean_subtitles)
-        translate_btn = QPushButton("Translate subtitles")
+        translate_btn = self._make_button("Translate subtitles", "subtitles")
         translate_btn.clicked.connect(self.translate_subtitles)
-        open_subtitles_btn = QPushButton("Open subtitles folder")
+        open_subtitles_btn = self._make_button("Open subtitles folder", "subtitles")
         open_subtitles_btn.clicked.connect(lambda: open_folder_in_explorer(get_subtitles_dir()))
         subtitles_layout.addWidget(extract_btn)
         subtitles_layout.addWidget(clean_btn)
@@ -5065,13 +6125,13 @@ class VideoProcessingApp(QMainWindow):
         
         # Process video section
         process_group = QGroupBox("PROCESS VIDEO")
-        process_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        process_group.setProperty("role", "section")
         process_layout = QHBoxLayout()
-        process_720_btn = QPushButton("Burn subtitles + watermark (720p)")
+        process_720_btn = self._make_button("Burn subtitles + watermark (720p)", "process")
         process_720_btn.clicked.connect(lambda: self.process_video("720"))
-        process_1080_btn = QPushButton("Burn subtitles + watermark (1080p)")
+        process_1080_btn = self._make_button("Burn subtitles + watermark (1080p)", "process")
         process_1080_btn.clicked.connect(lambda: self.process_video("1080"))
-        open_output_btn = QPushButton("Open output folder")
+        open_output_btn = self._make_button("Open output folder", "process")
         open_output_btn.clicked.connect(lambda: open_folder_in_explorer(get_output_dir()))
         process_layout.addWidget(process_720_btn)
         process_layout.addWidget(process_1080_btn)
@@ -5086,13 +6146,13 @@ class VideoProcessingApp(QMainWindow):
         
         # Operation type label
         self.progress_operation_label = QLabel("Ready")
-        self.progress_operation_label.setFont(QFont("Arial", 10, QFont.Bold))
+        self.progress_operation_label.setFont(self._BOLD10_FONT)
         progress_layout.addWidget(self.progress_operation_label)
         
         # Current file label
         self.progress_file_label = QLabel("")
         self.progress_file_label.setFont(QFont("Arial", 9))
-        self.progress_file_label.setStyleSheet("color: #666;")
+        self._set_text_color(self.progress_file_label, "#666")
         progress_layout.addWidget(self.progress_file_label)
         
         # Progress bar with counter
@@ -5127,26 +6187,7 @@ class VideoProcessingApp(QMainWindow):
         self.stop_btn = QPushButton("Stop")
         self.stop_btn.setFixedWidth(80)
         self.stop_btn.clicked.connect(self.stop_operation)
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #cc0000;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 4px 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #990000;
-            }
-            QPushButton:pressed {
-                background-color: #660000;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
+        self.stop_btn.setProperty("role", "stop")
         self.stop_btn.setToolTip("Stop the current operation (Ctrl+C)")
         progress_bar_layout.addWidget(self.stop_btn)
         
@@ -5159,11 +6200,14 @@ class VideoProcessingApp(QMainWindow):
         
         # Log output
         log_group = QGroupBox("LOG OUTPUT")
-        log_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        log_group.setProperty("role", "section")
         log_layout = QVBoxLayout()
-        self.log_output = QTextEdit()
+        # Plain text log capped at _LOG_MAX_BLOCKS lines, like the transcription log
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(_LOG_MAX_BLOCKS)
         self.log_output.setFont(QFont("Monaco", 9))
+        self._log_scrollbar = self.log_output.verticalScrollBar()  # Checked on every log flush
         log_layout.addWidget(self.log_output)
         log_group.setLayout(log_layout)
         layout.addWidget(log_group)
@@ -5171,13 +6215,16 @@ class VideoProcessingApp(QMainWindow):
         # Add main tab to tabs widget
         self.main_tabs.addTab(main_tab, "Subtitles")
         
-        # Add transcription tab
-        transcription_tab = self.create_transcription_tab()
-        self.main_tabs.addTab(transcription_tab, "Transcription")
-        
-        # Add remuxing tab
-        remuxing_tab = self.create_remuxing_tab()
-        self.main_tabs.addTab(remuxing_tab, "Remuxing")
+        # Transcription and remuxing tabs are empty containers until first opened
+        self._lazy_tab_builders = {}
+        for title, builder in (("Transcription", self.create_transcription_tab),
+                               ("Remuxing", self.create_remuxing_tab)):
+            container = QWidget()
+            container_layout = QVBoxLayout(container)
+            container_layout.setContentsMargins(0, 0, 0, 0)
+            index = self.main_tabs.addTab(container, title)
+            self._lazy_tab_builders[index] = builder
+        self.main_tabs.currentChanged.connect(self.build_lazy_tab)
         
         # Add tabs to main layout
         main_layout.addWidget(self.main_tabs)
@@ -5188,16 +6235,36 @@ class VideoProcessingApp(QMainWindow):
         # Apply lesbian flag color scheme to all buttons
         self.apply_lesbian_flag_styles()
         
+        # One stylesheet for the whole app instead of per-widget setStyleSheet calls
+        QApplication.instance().setStyleSheet(APP_QSS)
+        
         # Track current operation type for color coding
         self.current_operation = None
     
     
     def log(self, message: str):
-        """Add a message to the log output."""
-        self.log_output.append(message)
-        self.log_output.verticalScrollBar().setValue(
-            self.log_output.verticalScrollBar().maximum()
-        )
+        """Queue a message for the log output; it is shown on the next flush."""
+        self.log_lines([message])
+    
+    def log_lines(self, lines: List[str]):
+        """Queue a batch of messages (e.g. from ScriptWorker.log_message) for the log output."""
+        self._log_buffer.extend(lines)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_log(self):
+        """Append all queued log messages to the log output at once."""
+        if not self._log_buffer:
+            return
+        # One joined string is one QString conversion and one document insert for the whole batch
+        text = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        # Follow new output only if the view is at (or a few lines from) the bottom; keep scrollback otherwise
+        scrollbar = self._log_scrollbar
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - _LOG_FOLLOW_TOLERANCE_LINES
+        self.log_output.appendPlainText(text)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
     
     def open_about(self):
         """Open About dialog."""
@@ -5211,17 +6278,23 @@ class VideoProcessingApp(QMainWindow):
     
     def open_settings(self):
         """Open settings dialog."""
-        dialog = SettingsDialog(self)
-        if dialog.exec_() == QDialog.Accepted:
-            self.config = load_config()
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self)
+        else:
+            self._settings_dialog.reload_from_config()
+        if self._settings_dialog.exec_() == QDialog.Accepted:
+            self.config = get_config()  # Saved copy from memory, no re-read
             self.log("Settings saved.")
     
     def open_whisper_options(self):
         """Open Whisper advanced options dialog."""
-        dialog = WhisperOptionsDialog(self)
-        if dialog.exec_() == QDialog.Accepted:
-            # Reload config after whisper options are saved
-            self.config = load_config()
+        if self._whisper_dialog is None:
+            self._whisper_dialog = WhisperOptionsDialog(self)
+        else:
+            self._whisper_dialog.reload_from_config()
+        if self._whisper_dialog.exec_() == QDialog.Accepted:
+            # Pick up the saved whisper options from memory, no re-read
+            self.config = get_config()
             self.log("Whisper options updated.")
     
     def run_script(self, script_func, *args, **kwargs):
@@ -5263,53 +6336,29 @@ class VideoProcessingApp(QMainWindow):
         self.statusBar().showMessage("Running...")
         
         self.worker = ScriptWorker(script_func, *args, **kwargs)
-        self.worker.log_message.connect(self.log)
+        self.worker.log_message.connect(self.log_lines)
         self.worker.progress_update.connect(self.on_progress_update)
         self.worker.finished.connect(self.on_script_finished)
         self.worker.start()
     
     def update_progress_bar_color(self):
         """Update progress bar color based on operation type."""
-        colors = {
-            "Downloading episodes": "#df4300",  # Red
-            "Extracting subtitles": "#f48a32",  # Orange
-            "Cleaning subtitles": "#f48a32",  # Orange
-            "Translating subtitles": "#ffab68",  # Light Orange
-            "Processing videos": "#dc7bb3",  # Pink
-            "Remuxing videos": "#c46ea1",  # Purple
-            "Transcribing video": "#b42075",  # Dark Pink
-        }
-        
-        color = colors.get(self.current_operation, "#df4300")
-        hover_color = self.darken_color(color, 0.15)
-        
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                text-align: center;
-                background-color: #f0f0f0;
-                font-weight: bold;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 4px;
-            }}
-        """)
+        color = _PROGRESS_BAR_COLORS.get(self.current_operation, "#df4300")
+        stylesheet = _progress_bar_stylesheet(color)
+        # Setting an identical stylesheet still makes Qt re-parse and re-polish
+        if self.progress_bar.styleSheet() != stylesheet:
+            self.progress_bar.setStyleSheet(stylesheet)
     
     def on_progress_update(self, current: int, total: int, filename: str):
         """Handle progress update."""
         # Try to extract percentage from filename (format: "filename.mp4 (45.2%)")
         file_percentage = None
-        if filename and '(' in filename and '%' in filename:
-            try:
-                # Extract percentage from filename like "video.mp4 (45.2%)"
-                match = re.search(r'\((\d+\.?\d*)%\)', filename)
-                if match:
-                    file_percentage = float(match.group(1))
-            except (ValueError, AttributeError):
-                pass
+        if filename and filename.endswith('%)'):
+            match = _PROGRESS_PERCENT_RE.search(filename)
+            if match:
+                file_percentage = float(match.group(1))
         
+        percent = None
         if total > 0:
             if file_percentage is not None:
                 # Calculate combined progress: file-level progress + per-file percentage
@@ -5322,7 +6371,14 @@ class VideoProcessingApp(QMainWindow):
             else:
                 # Fallback to file-level progress only
                 percent = int((current / total) * 100)
-            
+        
+        # Nothing visible changes if the bar, counter and file line would show the same as now
+        progress_state = (percent, current, total, filename)
+        if progress_state == self._last_progress_state:
+            return
+        self._last_progress_state = progress_state
+        
+        if percent is not None:
             self.progress_bar.setValue(percent)
             self.progress_counter_label.setText(f"{current}/{total}")
         else:
@@ -5344,6 +6400,7 @@ class VideoProcessingApp(QMainWindow):
     
     def on_script_finished(self, success: bool):
         """Handle script completion."""
+        self._last_progress_state = None
         self.progress_group.setVisible(False)
         self.progress_bar.setRange(0, 100)  # Reset to determinate mode
         self.progress_bar.setValue(0)
@@ -5359,6 +6416,7 @@ class VideoProcessingApp(QMainWindow):
             self.log("✓ Operation completed successfully.")
         else:
             self.log("✗ Operation failed. Check log for details.")
+        self._flush_log()
         self.worker = None
     
     def stop_operation(self):
@@ -5381,11 +6439,24 @@ class VideoProcessingApp(QMainWindow):
         if self.worker and self.worker.isRunning():
             self.log("⚠ Force terminating operation...")
             self.worker.terminate()
-            self.worker.wait()
-            self.on_script_finished(False)
+            # Poll instead of wait() so the UI stays responsive while the thread unwinds
+            self._check_worker_terminated(self.worker, _TERMINATE_POLL_ATTEMPTS)
+            return
         # Reset button text
         self.stop_btn.setText("Stop")
     
+    def _check_worker_terminated(self, worker: ScriptWorker, attempts_left: int):
+        """Finish a forced stop once the terminated worker thread has ended (or give up on it)."""
+        if worker.isRunning() and attempts_left > 0:
+            QTimer.singleShot(_TERMINATE_POLL_MS, lambda: self._check_worker_terminated(worker, attempts_left - 1))
+            return
+        if worker.isRunning():
+            self.log("⚠ Operation did not stop; it will be cleaned up when the app exits")
+            self._stuck_workers.append(worker)
+        if self.worker is worker:
+            self.on_script_finished(False)
+        self.stop_btn.setText("Stop")
+    
     def download_episodes(self):
         """Download episodes."""
         commands_text = self.commands_text.toPlainText()
@@ -5402,10 +6473,15 @@ class VideoProcessingApp(QMainWindow):
         
         # Create a wrapper that adds detection after download
         def download_with_detection(commands_text, output_dir, episode_spec, progress_callback=None, log_callback=None):
+            before = snapshot_mkv_mtimes(output_dir)
             result = download_episodes(commands_text, output_dir, episode_spec, progress_callback, log_callback)
             if result:
-                # Detect episode/scene for downloaded files
-                mkv_files = list(output_dir.glob("*.mkv"))
+                # Detect episode/scene only for files this download created or rewrote
+                after = snapshot_mkv_mtimes(output_dir)
+                mkv_files = [output_dir / name for name, mtime in sorted(after.items()) if before.get(name) != mtime]
+                # Durations come from the MKV header; only files without one need
+                # ffprobe, and those are probed together before logging in order
+                probe_many([f for f in mkv_files if read_container_duration(f) is None])
                 for mkv_file in mkv_files:
                     video_type, duration = detect_episode_or_scene(mkv_file)
                     if duration is not None:
@@ -5435,21 +6511,29 @@ class VideoProcessingApp(QMainWindow):
                 if dest_path.exists():
                     self.log(f"Skipping {source_path.name} - already exists")
                     continue
-                shutil.copy2(file_path, dest_path)
+                copy_file_fast(source_path, dest_path)
                 copied_count += 1
                 
-                # Detect episode or scene
-                video_type, duration = detect_episode_or_scene(dest_path)
-                if duration is not None:
-                    type_label = "Episode" if video_type == "episode" else "Scene"
-                    self.log(f"Copied: {source_path.name} ({type_label}, {duration:.1f} min)")
-                else:
-                    self.log(f"Copied: {source_path.name}")
+                # Detect episode or scene in the thread pool; on_video_type_detected logs the copy
+                job = VideoTypeRunnable(dest_path)
+                job.signals.finished.connect(self.on_video_type_detected)
+                self._video_type_signals.add(job.signals)  # Keep alive until the result arrives
+                QThreadPool.globalInstance().start(job)
             except Exception as e:
                 self.log(f"Error copying {Path(file_path).name}: {e}")
         
         QMessageBox.information(self, "Complete", f"Added {copied_count} file(s) to downloads folder.")
     
+    def on_video_type_detected(self, video_path_str: str, video_type: str, duration: Optional[float]):
+        """Log a copied video together with its detected episode/scene type."""
+        self._video_type_signals.discard(self.sender())
+        name = Path(video_path_str).name
+        if duration is not None:
+            type_label = "Episode" if video_type == "episode" else "Scene"
+            self.log(f"Copied: {name} ({type_label}, {duration:.1f} min)")
+        else:
+            self.log(f"Copied: {name}")
+    
     def extract_subtitles(self):
         """Extract subtitles."""
         downloads_dir = get_downloads_dir()
@@ -5589,16 +6673,10 @@ class VideoProcessingApp(QMainWindow):
         # Get model from combo (saved to config automatically)
         model = self.transcribe_model_combo.currentText()
         
-        # Get whisper options from config
-        config = load_config()
+        # Get whisper options from the in-memory config (kept current by the settings dialogs)
+        config = self.config
         whisper_options = config.get("whisper_options", {})
         
-        # Process extra_args: convert multiline to space-separated if needed
-        if "extra_args" in whisper_options and "extra_args_parsed" not in whisper_options:
-            extra_args_text = whisper_options.get("extra_args", "")
-            extra_args = " ".join(line.strip() for line in extra_args_text.split("\n") if line.strip())
-            whisper_options["extra_args_parsed"] = extra_args
-        
         # Check if this is first time using transcription
         whisper_model_asked = config.get("whisper_model_asked", False)
         
@@ -5650,16 +6728,10 @@ class VideoProcessingApp(QMainWindow):
         # Get model from combo (saved to config automatically)
         model = self.transcribe_model_combo.currentText()
         
-        # Get whisper options and output format
-        config = load_config()
+        # Get whisper options and output format (in-memory config, kept current by the settings dialogs)
+        config = self.config
         whisper_options = config.get("whisper_options", {})
         
-        # Process extra_args: convert multiline to space-separated if needed
-        if "extra_args" in whisper_options and "extra_args_parsed" not in whisper_options:
-            extra_args_text = whisper_options.get("extra_args", "")
-            extra_args = " ".join(line.strip() for line in extra_args_text.split("\n") if line.strip())
-            whisper_options["extra_args_parsed"] = extra_args
-        
         output_format = self.transcribe_format_combo.currentData()
         
         # Check if this is first time using transcription
@@ -5708,15 +6780,11 @@ class VideoProcessingApp(QMainWindow):
                 whisper_options, output_format, adjust_timestamps, progress_callback, log_callback
             )
         
-        # Use custom callbacks for the tab
-        def tab_log_callback(msg):
-            self.transcribe_log(msg)
-        
         self.worker = ScriptWorker(
             transcribe_range_with_params, video_path, start_seconds, end_seconds, 
             language_code, model, whisper_options, output_format, adjust_timestamps
         )
-        self.worker.log_message.connect(tab_log_callback)
+        self.worker.log_message.connect(self.transcribe_log_lines)
         self.worker.finished.connect(self.on_transcribe_finished)
         self.worker.start()
 
@@ -5736,11 +6804,12 @@ def main():
     icon = get_app_icon()
     app.setWindowIcon(icon)
     
+    # The window sets the same cached icon on its title bar in __init__
     window = VideoProcessingApp()
-    # Also set window icon (for title bar)
-    window.setWindowIcon(icon)
     window.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    save_track_cache()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
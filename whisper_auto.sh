@@ -124,13 +124,14 @@ WHISPER_CMD=(
 
 # Append user-provided extra arguments if set
 if [ -n "${WHISPER_EXTRA_ARGS}" ]; then
-  # Split WHISPER_EXTRA_ARGS by spaces and add each as a separate argument
+  # WHISPER_EXTRA_ARGS holds one argument per line (already split by the app)
   # This handles both flags (--flag) and options with values (--option value)
-  # Note: For values with spaces, users should quote them in the UI
-  IFS=' ' read -ra EXTRA_ARGS <<< "$WHISPER_EXTRA_ARGS"
-  for arg in "${EXTRA_ARGS[@]}"; do
-    WHISPER_CMD+=("$arg")
-  done
+  # Values quoted in the UI (e.g. paths with spaces) arrive as a single line
+  while IFS= read -r arg; do
+    if [ -n "$arg" ]; then
+      WHISPER_CMD+=("$arg")
+    fi
+  done <<< "$WHISPER_EXTRA_ARGS"
 fi
 
 # Execute the command